@@ -4,20 +4,30 @@ YouTube Feed Downloader - Downloads ALL new videos from channels automatically a
 Fixed video discovery logic and display formatting.
 """
 
+import atexit
+import errno
+import functools
+import hashlib
+import heapq
+import importlib
 import json
 import logging
 import logging.handlers
 import re
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional, Any, List, Tuple
-import select
+from typing import Dict, Optional, Any, List, Set, Tuple, Iterator, Union
+import shutil
+import signal
+import stat as stat_module
 import os
-import glob
 import argparse
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import readline
@@ -38,6 +48,31 @@ from rich.console import Group
 from rich.text import Text
 from rich import print as rprint
 
+# POSIX-only: used to enlarge subprocess pipes
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Optional: faster JSON (de)serialisation for the state files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=None)
+def load_optional_module(name: str):
+    """Import an optional dependency on first use, returning None when it is not installed.
+
+    mutagen (in-process media durations) and yt_dlp (in-process channel listings) are
+    only needed by some runs, so startup and --help do not pay for importing them.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
 # Initialize Rich Console
 custom_theme = Theme({
     "info": "cyan",
@@ -49,6 +84,186 @@ custom_theme = Theme({
 })
 console = Console(theme=custom_theme)
 
+def loads_json(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document, using orjson when it is installed. Accepts raw bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json_file(path: Path) -> Any:
+    """Read a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_json_file(path: Path, data: Any, indent: bool = True) -> None:
+    """Atomically write data as UTF-8 JSON, using orjson when it is installed.
+
+    The data goes to a temporary file in the same directory which is fsynced and
+    then renamed over the target, so a crash never leaves a truncated state file.
+    """
+    # Unique per thread so concurrent saves of the same file never share a temp file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0))
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2 if indent else None, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Regex for matching duration suffixes like "-28hr 17min", "-28.5hr", "-45sec"
+DURATION_REGEX = re.compile(r'\s*-\s*\d+(?:\.\d+)?(?:hr|min|sec|h|m|s)(?:\s*\d+(?:\.\d+)?(?:min|sec|m|s))?$', re.IGNORECASE)
+
+# Older suffix formats ("-5min", "-45sec", "-4.5sec") fused into one pattern
+LEGACY_DURATION_REGEX = re.compile(r'\s*-\s*(?:\d+[hmr]\s*\d*[ms]?in?|\d+(?:\.\d+)?sec)$')
+
+# Read buffer and kernel pipe size for yt-dlp output streams
+PIPE_BUFFER_SIZE = 1 << 20
+
+
+def enlarge_pipe(stream: Any) -> None:
+    """Grow a subprocess pipe's kernel buffer so chatty output needs fewer reads (Linux only)."""
+    if fcntl is None:
+        return
+    try:
+        fcntl.fcntl(stream.fileno(), getattr(fcntl, 'F_SETPIPE_SZ', 1031), PIPE_BUFFER_SIZE)
+    except OSError:
+        # Above /proc/sys/fs/pipe-max-size for unprivileged users; keep the default
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_executable(name: str) -> str:
+    """Return the absolute path of a program on PATH, or name unchanged when it isn't found."""
+    return shutil.which(name) or name
+
+
+def spawn_command(cmd: List[str]) -> List[str]:
+    """Return cmd with its program resolved to an absolute path.
+
+    With an absolute path and close_fds=False, CPython launches the child with
+    posix_spawn instead of fork+exec and skips the PATH search on every spawn.
+    Our own descriptors are non-inheritable (PEP 446), so keeping fds open leaks nothing.
+    """
+    return [resolve_executable(cmd[0]), *cmd[1:]]
+
+
+# Byte multipliers for yt-dlp size strings like "10.00MiB"
+SIZE_UNITS = {
+    'B': 1, 'KiB': 1024, 'MiB': 1024 ** 2, 'GiB': 1024 ** 3, 'TiB': 1024 ** 4,
+    'KB': 1000, 'MB': 1000 ** 2, 'GB': 1000 ** 3, 'TB': 1000 ** 4
+}
+
+
+SIZE_REGEX = re.compile(r'~?\s*(\d+(?:\.\d+)?)\s*([KMGT]?i?B)')
+
+
+def parse_size(size: str) -> float:
+    """Convert a yt-dlp size string such as "10.00MiB" to bytes (0 if unparseable)."""
+    match = SIZE_REGEX.match(size)
+    if not match:
+        return 0.0
+    return float(match.group(1)) * SIZE_UNITS.get(match.group(2), 0)
+
+
+# Containers mutagen can read; Matroska/WebM, AVI and FLV always need ffmpeg
+MUTAGEN_EXTENSIONS = frozenset({
+    '.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.mp4', '.mov'
+})
+
+# yt-dlp flags shared by every download command (single videos, audio and playlists)
+YTDLP_COMMON_FLAGS = (
+    "--no-cookies",
+    "--no-cache-dir",
+    "--no-part",
+    "--no-mtime",
+    "--newline",
+    "--no-warnings",
+    "--progress",
+    "--retries", "10",
+    "--fragment-retries", "10",
+    "--file-access-retries", "5",
+    "--socket-timeout", "30",
+)
+
+# Format selection and post-processing for 320kbps MP3 downloads
+YTDLP_AUDIO_FLAGS = (
+    "-f", "bestaudio[ext=m4a]/bestaudio/best",
+    "--extract-audio",
+    "--audio-format", "mp3",
+    "--audio-quality", "320K",
+    "--embed-metadata",
+    "--embed-thumbnail",
+)
+
+# Characters not allowed in file and directory names, as str.translate tables
+UNSAFE_FILENAME_CHARS = '<>:"/\\|?*'
+REPLACE_UNSAFE_CHARS = str.maketrans(dict.fromkeys(UNSAFE_FILENAME_CHARS, '_'))
+STRIP_UNSAFE_CHARS = str.maketrans('', '', UNSAFE_FILENAME_CHARS)
+
+# Runs of whitespace, collapsed when matching titles against file names
+WHITESPACE_REGEX = re.compile(r'\s+')
+
+# Anything but word characters, "@", "." and "-" in channel history file names
+HANDLE_UNSAFE_REGEX = re.compile(r'[^\w@.-]')
+
+# All yt-dlp progress line shapes in one pass; the outer group name tells which one matched
+PROGRESS_REGEX = re.compile(
+    r'(?P<download>\[download\]\s+(?P<percent>\d+\.?\d*)%\s+of\s+~?\s*(?P<size>\d+\.?\d*)(?P<size_unit>\w+)'
+    r'\s+at\s+(?P<speed>\d+\.?\d*)(?P<speed_unit>\w+)/s\s+ETA\s+(?P<eta>\d+:\d+|\d+))'
+    r'|(?P<extract>\[ExtractAudio\]\s+Destination:\s+(?P<file>.+))'
+    r'|(?P<converting>\[FFmpeg\]\s+Converting\s+.+\s+to\s+.+)'
+    r'|(?P<playlist_progress>\[download\]\s+Downloading\s+item\s+(?P<current>\d+)\s+of\s+(?P<total>\d+))'
+    r'|(?P<starting>\[download\] Destination:)'
+)
+
+# Raw line prefixes that can carry progress; other output is never decoded for parsing
+PROGRESS_LINE_TAGS = (b'[download]', b'[ExtractAudio]', b'[FFmpeg]')
+PROGRESS_LINE_PREFIXES = tuple(tag.decode('ascii') for tag in PROGRESS_LINE_TAGS)
+
+# ffmpeg's per-input header and duration lines, used for batched duration probes
+FFMPEG_INPUT_REGEX = re.compile(r'^Input #(\d+), ')
+FFMPEG_DURATION_REGEX = re.compile(r'^\s+Duration: (\d+):(\d{2}):(\d{2}(?:\.\d+)?)')
+
+# File extensions counted when totalling media durations
+MEDIA_EXTENSIONS = frozenset({
+    '.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a',
+    '.mp4', '.mkv', '.avi', '.mov', '.flv', '.webm'
+})
+
+# Returned instead of a plain [] when a source could not be listed at all, so callers
+# can tell a failed query from an empty one (compare with `is`, never mutate)
+LISTING_FAILED: List[Dict[str, Any]] = []
+
+
+@functools.lru_cache(maxsize=4096)
+def format_whole_duration_short(seconds: int) -> str:
+    """Format whole seconds as '3hr 45min', '2min 5sec' or '26sec' (memoised)."""
+    hours, remainder = divmod(seconds, 3600)
+    minutes, remaining_seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}hr {minutes}min" if minutes else f"{hours}hr"
+    if minutes:
+        return f"{minutes}min {remaining_seconds}sec" if remaining_seconds else f"{minutes}min"
+    return f"{remaining_seconds}sec"
+
 
 # --- CONFIGURATION ---
 @dataclass
@@ -70,6 +285,11 @@ class Config:
     max_retries: int = 2
     retry_delay: int = 3
     max_parallel_downloads: int = 3
+    auto_tune_parallel_downloads: bool = False  # Opt in: pick the pool size from measured throughput
+    max_auto_parallel_downloads: int = 8  # Upper bound for the auto-tuned download pool
+    last_download_speed: float = 0.0  # Aggregate bytes/s of the last saturated batch, for auto-tuning
+    tuned_parallel_downloads: int = 0  # Pool size chosen by auto-tuning; 0 = start from max_parallel_downloads
+    max_parallel_probes: int = 8  # Concurrent ffprobe workers when scanning media durations
     
     # Log settings
     max_log_files: int = 10
@@ -88,29 +308,37 @@ class Config:
     filter_shorts: bool = True  # Skip videos shorter than 60 seconds
     ask_video_limit_per_channel: bool = False  # Ask for video limit for every channel
     gap_check_limit: int = 10 # How many videos to check to find the "gap" since last run
+    min_recheck_seconds: int = 0  # Skip channels checked more recently than this (0 = always check)
+    in_process_listings: bool = False  # Opt in: list sources with the yt_dlp module instead of the killable CLI
 
     
-    def __post_init__(self):
-        """Create base directories if they don't exist."""
-        self.base_video_dir.mkdir(parents=True, exist_ok=True)
-        self.base_audio_dir.mkdir(parents=True, exist_ok=True)
-        self.base_playlist_dir.mkdir(parents=True, exist_ok=True)
-        self.base_podcast_dir.mkdir(parents=True, exist_ok=True)
-        self.log_dir.mkdir(parents=True, exist_ok=True)
-    # Regex for matching duration suffixes like "-28hr 17min", "-28.5hr", "-45sec"
-    DURATION_REGEX = re.compile(r'\s*-\s*\d+(\.\d+)?(?:hr|min|sec|h|m|s)(?:\s*\d+(\.\d+)?(?:min|sec|m|s))?$', re.IGNORECASE)
-
     class DirectoryDurationCache:
+        # Checkpoint interval so long scans don't lose all probed durations on a crash
+        FLUSH_INTERVAL = 5.0
+
         def __init__(self, cache_file: Path):
             self.cache_file = cache_file
+            self.dirs: Dict[str, Tuple[int, int, float, int]] = {}  # path -> (tree mtime_ns, media count, seconds, files)
             self.cache = self._load_cache()
             self._dirty = False
+            self._last_flush = time.monotonic()
 
-        def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        def _load_cache(self) -> Dict[str, Tuple[Any, int, float]]:
+            """Load entries as (mtime_ns, size, duration) tuples, migrating the old dict-per-entry format."""
             if self.cache_file.exists():
                 try:
-                    with open(self.cache_file, 'r') as f:
-                        return json.load(f)
+                    raw = load_json_file(self.cache_file)
+                    if "files" in raw:
+                        self.dirs = {key: tuple(entry) for key, entry in raw.get("dirs", {}).items()}
+                        raw = raw["files"]
+                    cache = {}
+                    for key, entry in raw.items():
+                        if isinstance(entry, dict):
+                            # Legacy entries keep their float mtime until get() upgrades them
+                            cache[key] = (entry['mtime'], entry['size'], entry['duration'])
+                        else:
+                            cache[key] = tuple(entry)
+                    return cache
                 except Exception:
                     return {}
             return {}
@@ -118,36 +346,56 @@ class Config:
         def save(self):
             if self._dirty:
                 try:
-                    with open(self.cache_file, 'w') as f:
-                        json.dump(self.cache, f)
+                    save_json_file(self.cache_file, {"files": self.cache, "dirs": self.dirs}, indent=False)
                     self._dirty = False
                 except Exception:
                     pass
+            self._last_flush = time.monotonic()
+
+        def flush_if_due(self):
+            """Save pending entries if the last flush is older than FLUSH_INTERVAL."""
+            if self._dirty and time.monotonic() - self._last_flush > self.FLUSH_INTERVAL:
+                self.save()
 
-        def get(self, file_path: Path) -> Optional[float]:
+        def get(self, file_path: Path, stat: Optional[os.stat_result] = None) -> Optional[float]:
             key = str(file_path)
             if key in self.cache:
-                entry = self.cache[key]
+                mtime_ns, size, duration = self.cache[key]
                 try:
-                    stat = file_path.stat()
-                    if entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size:
-                        return entry['duration']
+                    if stat is None:
+                        stat = file_path.stat()
+                    if size == stat.st_size:
+                        if mtime_ns == stat.st_mtime_ns:
+                            return duration
+                        if mtime_ns == stat.st_mtime:
+                            # Legacy float-seconds entry: upgrade in place
+                            self.cache[key] = (stat.st_mtime_ns, size, duration)
+                            self._dirty = True
+                            return duration
                 except FileNotFoundError:
                     pass
             return None
 
-        def set(self, file_path: Path, duration: float):
+        def set(self, file_path: Path, duration: float, stat: Optional[os.stat_result] = None):
             try:
-                stat = file_path.stat()
-                self.cache[str(file_path)] = {
-                    'mtime': stat.st_mtime,
-                    'size': stat.st_size,
-                    'duration': duration
-                }
+                if stat is None:
+                    stat = file_path.stat()
+                self.cache[str(file_path)] = (stat.st_mtime_ns, stat.st_size, duration)
                 self._dirty = True
             except FileNotFoundError:
                 pass
 
+        def get_dir(self, directory: Path, signature: Tuple[int, int]) -> Optional[Tuple[float, int]]:
+            """Return (total_seconds, file_count) for a directory tree if its signature is unchanged."""
+            entry = self.dirs.get(str(directory))
+            if entry is not None and (entry[0], entry[1]) == signature:
+                return entry[2], entry[3]
+            return None
+
+        def set_dir(self, directory: Path, signature: Tuple[int, int], total_seconds: float, file_count: int):
+            self.dirs[str(directory)] = (signature[0], signature[1], total_seconds, file_count)
+            self._dirty = True
+
     def __post_init__(self):
         """Create base directories if they don't exist."""
         self.base_video_dir.mkdir(parents=True, exist_ok=True)
@@ -159,19 +407,28 @@ class Config:
         
         # Initialize duration cache
         self.duration_cache = self.DirectoryDurationCache(self.log_dir / "directory_durations.json")
+        atexit.register(self.duration_cache.save)
         self.config_path = self.log_dir / "config.json"
         self.last_download_path = self.log_dir / "last_download.json"
         self.app_log_path = self.log_dir / "YT_feed.log"
         self.resume_state_path = self.log_dir / "resume_state.json"
         self.channel_history_path = self.log_dir / "channel_history.json"
+        self.channel_history_dir = self.log_dir / "channel_history"
         self.setup_log_cleanup()
 
     def setup_log_cleanup(self):
         """Setup log rotation and cleanup."""
         log_files = list(self.log_dir.glob("YT_feed*.log*"))
-        if len(log_files) > self.max_log_files:
-            log_files.sort(key=lambda x: x.stat().st_mtime)
-            for old_log in log_files[:-self.max_log_files]:
+        excess = len(log_files) - self.max_log_files
+        if excess > 0:
+            # Stat each file once, then pick only the oldest ones instead of sorting everything
+            dated_logs = []
+            for log_file in log_files:
+                try:
+                    dated_logs.append((log_file.stat().st_mtime, log_file))
+                except OSError:
+                    pass
+            for _, old_log in heapq.nsmallest(excess, dated_logs, key=lambda item: item[0]):
                 try:
                     old_log.unlink()
                 except OSError:
@@ -198,11 +455,176 @@ class Config:
         return self.base_podcast_dir
 
 
+class YtDlpLogger:
+    """Logger handed to in-process yt_dlp: keeps its warnings, drops its progress chatter.
+
+    yt-dlp routes every screen message through debug(), and extraction errors are
+    raised as DownloadError and logged by the caller, so only warnings are forwarded.
+    """
+    
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+    
+    def debug(self, msg: str) -> None:
+        pass
+    
+    def info(self, msg: str) -> None:
+        pass
+    
+    def warning(self, msg: str) -> None:
+        self.logger.warning("⚠️ yt-dlp: %s", msg)
+    
+    def error(self, msg: str) -> None:
+        pass
+
+
+@dataclass
+class DownloadTask:
+    """A queued download and the history entry it updates when it completes."""
+    __slots__ = ("video_info", "source_name", "task_type", "source_key")
+    
+    video_info: Dict[str, Any]
+    source_name: str
+    task_type: str  # "channel" or "playlist"
+    source_key: str  # Channel handle or playlist URL
+
+
+class ConcurrencyController:
+    """Tune the download pool size from the aggregate throughput of each batch.
+
+    Grows the pool while batch throughput keeps improving and backs off when it
+    drops by more than DROP_TOLERANCE. A stalled or rate-limited download shrinks
+    the pool at once: workers take a slot before each download, and no more than
+    current slots are handed out.
+    """
+    
+    STEP_UP = 2
+    STEP_DOWN = 1
+    DROP_TOLERANCE = 0.10
+    
+    def __init__(self, current: int, lower: int = 2, upper: int = 8):
+        self.lower = max(1, min(lower, upper))
+        self.upper = max(self.lower, upper)
+        self.current = min(max(current, self.lower), self.upper)
+        self.last_speed = 0.0
+        self._lock = threading.Lock()
+        self._slot_free = threading.Condition(self._lock)
+        self._active = 0
+        self._bytes = 0.0
+        self._stalled = False
+        self._started = 0.0
+    
+    def clamp(self, value: int) -> int:
+        """Limit a pool size to [lower, upper]."""
+        return min(max(value, self.lower), self.upper)
+    
+    def reseed(self, value: int) -> None:
+        """Start the next batch from value, kept within the controller's bounds."""
+        self.current = self.clamp(value)
+    
+    def start_batch(self) -> None:
+        """Reset the counters before a batch of downloads."""
+        with self._lock:
+            self._bytes = 0.0
+            self._stalled = False
+        self._started = time.monotonic()
+    
+    def acquire_slot(self) -> None:
+        """Block until fewer than current downloads are running, then take a slot."""
+        with self._slot_free:
+            while self._active >= self.current:
+                self._slot_free.wait()
+            self._active += 1
+    
+    def release_slot(self) -> None:
+        """Give back a slot taken with acquire_slot."""
+        with self._slot_free:
+            self._active -= 1
+            self._slot_free.notify()
+    
+    def add_bytes(self, count: float) -> None:
+        """Record bytes transferred by a finished download (called from worker threads)."""
+        with self._lock:
+            self._bytes += count
+    
+    def record_stall(self) -> None:
+        """Record a timed-out or throttled download and shrink the live pool by STEP_DOWN."""
+        with self._lock:
+            self._stalled = True
+            self.current = max(self.current - self.STEP_DOWN, self.lower)
+    
+    def finish_batch(self, task_count: int) -> int:
+        """Adjust the pool size from the finished batch and return the new value."""
+        elapsed = time.monotonic() - self._started
+        with self._lock:
+            speed = self._bytes / elapsed if elapsed > 0 else 0.0
+            stalled = self._stalled
+        
+        # A stalled batch already shrank current in record_stall
+        if not stalled and task_count >= self.current and speed > 0:
+            # Only a saturated pool says anything about whether more workers help
+            if speed > self.last_speed:
+                self.current = min(self.current + self.STEP_UP, self.upper)
+            elif speed < self.last_speed * (1 - self.DROP_TOLERANCE):
+                self.current = max(self.current - self.STEP_DOWN, self.lower)
+        if speed > 0:
+            self.last_speed = speed
+        return self.current
 
 
 class YouTubeFeedDownloader:
     """Main class for downloading YouTube content with multi-video channel support."""
     
+    # Minimum seconds between history/resume state rewrites during bulk updates
+    STATE_FLUSH_INTERVAL = 5.0
+
+    # Completed parallel downloads between download history rewrites
+    HISTORY_SAVE_BATCH = 5
+    
+    # Number of per-channel history files kept in memory at once
+    CHANNEL_CACHE_SIZE = 64
+
+    # Concurrent yt-dlp listing queries when checking sources for new videos
+    MAX_PARALLEL_LISTINGS = 8
+    
+    # Files handed to a single ffmpeg process when probing durations
+    PROBE_BATCH_SIZE = 64
+
+    # Rich progress updates are skipped unless this many seconds or percent points have passed
+    PROGRESS_UPDATE_INTERVAL = 0.1
+    PROGRESS_UPDATE_STEP = 0.5
+
+    # Prebuilt progress bar strips; redraws slice these instead of building new strings
+    _BAR_FULL = "█" * 200
+    _BAR_EMPTY = "░" * 200
+    # Carriage return + clear line, then the bar's opening bracket
+    _BAR_PREFIX = "\r\033[K   ["
+    
+    # Numeric settings menu entries: choice -> (config field, prompt, label, minimum, maximum);
+    # a maximum of None means up to the current max_videos_per_channel
+    _NUMERIC_SETTINGS = {
+        "1": ("max_parallel_downloads", "Enter new parallel download count", "Parallel downloads", 1, 5),
+        "2": ("resume_cache_days", "Enter resume cache days", "Resume cache days", 1, 30),
+        "4": ("initial_videos_per_channel", "Enter auto-download recent videos count", "Auto-download recent videos", 0, None),
+        "5": ("max_videos_per_channel", "Enter max videos to check per channel", "Max videos to check per channel", 1, 200),
+    }
+    
+    # Static option lists of the management submenus, printed under their dynamic headers
+    _CHANNEL_MENU = "\n".join([
+        "─" * 40,
+        "1. 📋 List channels",
+        "2. ➕ Add channel",
+        "3. 🗑️ Remove channel",
+        "4. ↩️ Back to main menu",
+    ])
+    _PLAYLIST_MENU = "\n".join([
+        "─" * 40,
+        "1. 📋 List playlists",
+        "2. ➕ Add playlist",
+        "3. 🗑️ Remove playlist",
+        "4. ↩️ Back to main menu",
+    ])
+    
     def __init__(self, config: Config):
         """Initialize the downloader with configuration."""
         self.config = config
@@ -213,7 +635,44 @@ class YouTubeFeedDownloader:
         self.download_history: Dict[str, Any] = {"channels": {}, "playlists": {}}
         self.last_download: Dict[str, Any] = {}
         self.resume_state: Dict[str, Any] = {}
-        self.channel_history: Dict[str, Any] = {}  # Tracks all downloaded videos per channel
+        self.channel_history: Dict[str, Any] = {}  # Index of channels with downloaded videos
+        self._channel_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # Lazily loaded per-channel files
+        self._dirty_channels = set()
+        self._channels_index: Dict[str, Any] = {}
+        self._first_run = True
+        
+        # Debounced persistence: mutations mark state dirty, writes happen at most every STATE_FLUSH_INTERVAL
+        self._history_dirty = False
+        self._history_last_flush = 0.0
+        self._resume_dirty = False
+        self._resume_last_flush = 0.0
+        # Download workers update resume state concurrently; changes and writes share this lock
+        # so a change made while the file is written is never marked as saved
+        self._resume_lock = threading.RLock()
+        self._last_download_dirty = False
+        self._last_download_last_flush = 0.0
+        self._last_download_lock = threading.RLock()  # Same role as _resume_lock
+        
+        # URL-independent download command prefixes, see build_download_command
+        self._download_args_cache: Dict[Tuple[Any, ...], Tuple[str, ...]] = {}
+        
+        # Legacy progress output is written whole under a lock so concurrent downloads
+        # never interleave partial lines; bars are skipped entirely when output is piped
+        self._stdout_lock = threading.Lock()
+        self._stdout_is_tty = sys.stdout.isatty()
+        
+        # Process groups of running listing queries; they run in their own sessions, out of
+        # reach of the terminal's Ctrl-C, so an interrupt has to kill them explicitly
+        self._child_groups: Set[int] = set()
+        self._child_groups_lock = threading.Lock()
+        # Set on interrupt so download workers still waiting for a slot don't start
+        self._stop_downloads = threading.Event()
+        
+        # Resolved once; a missing notify-send is not looked up again on every notification
+        self._notify_send = shutil.which("notify-send")
+        
+        # YT_feed* directories under ~/Videos, listed lazily and re-listed at the start of each run
+        self._yt_feed_dirs: Optional[List[Path]] = None
         
         # Setup logging
         self.setup_logging()
@@ -222,16 +681,32 @@ class YouTubeFeedDownloader:
         self.load_resume_state()
         self.load_channel_history()
         
+        # The floor is 1 so tuning never forces more workers than a user who chose 1 asked for
+        self.concurrency = ConcurrencyController(
+            self.config.max_parallel_downloads,
+            lower=1,
+            upper=max(self.config.max_auto_parallel_downloads, self.config.max_parallel_downloads)
+        )
+        self.concurrency.last_speed = self.config.last_download_speed
+        
         # Ensure we're using the correct current directory
         self.ensure_current_directories()
         
+        # Persist any debounced state on interpreter exit
+        atexit.register(self._flush_history)
+        atexit.register(self._flush_resume_state)
+        atexit.register(self._flush_last_download)
+        
     def send_notification(self, title: str, message: str, urgency: str = "normal") -> None:
-        """Send a desktop notification using notify-send."""
+        """Send a desktop notification using notify-send without waiting for it."""
+        if self._notify_send is None:
+            return
         try:
-            subprocess.run(
-                ["notify-send", "-u", urgency, "-a", "YT Feed", title, message],
-                check=False,
-                capture_output=True
+            subprocess.Popen(
+                [self._notify_send, "-u", urgency, "-a", "YT Feed", title, message],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
             )
         except Exception as e:
             # Don't crash if notifications fail
@@ -244,52 +719,69 @@ class YouTubeFeedDownloader:
             cutoff_time = time.time() - (self.config.cleanup_days * 86400)
             
             # Only clean in YT_feed directories
-            videos_dir = Path.home() / "Videos"
-            yt_feed_dirs = list(videos_dir.glob("YT_feed*"))
-            
-            for directory in yt_feed_dirs:
-                if directory.is_dir():
-                    for file_path in directory.glob("*"):
-                        if file_path.is_file():
-                            try:
-                                if file_path.stat().st_mtime < cutoff_time:
-                                    file_path.unlink()
-                                    cleaned_count += 1
-                                    self.logger.info(f"🧹 Deleted old file: {file_path.name}")
-                            except Exception as e:
-                                self.logger.warning(f"⚠️ Could not delete {file_path}: {e}")
+            for directory in self.get_yt_feed_dirs():
+                try:
+                    it = os.scandir(directory)
+                except (FileNotFoundError, NotADirectoryError):
+                    # Removed or replaced since it was listed; the other directories are still cleaned
+                    continue
+                with it:
+                    for entry in it:
+                        if not entry.is_file():
+                            continue
+                        try:
+                            if entry.stat().st_mtime < cutoff_time:
+                                os.unlink(entry.path)
+                                cleaned_count += 1
+                                self.logger.info("🧹 Deleted old file: %s", entry.name)
+                        except Exception as e:
+                            self.logger.warning("⚠️ Could not delete %s: %s", entry.path, e)
                                 
             if cleaned_count > 0:
                 console.print(f"[warning]🧹 Cleaned up {cleaned_count} videos older than {self.config.cleanup_days} days[/warning]")
                 self.send_notification("Cleanup Complete", f"Removed {cleaned_count} old videos")
                 
         except Exception as e:
-            self.logger.error(f"❌ Error during video cleanup: {e}")
+            self.logger.error("❌ Error during video cleanup: %s", e)
             
         return cleaned_count
+    
+    def get_yt_feed_dirs(self, refresh: bool = False) -> List[Path]:
+        """Return the YT_feed* directories in the Videos folder, rescanning it when refresh is set."""
+        if refresh or self._yt_feed_dirs is None:
+            videos_dir = Path.home() / "Videos"
+            try:
+                with os.scandir(videos_dir) as videos_it:
+                    self._yt_feed_dirs = [Path(entry.path) for entry in videos_it
+                                          if entry.name.startswith("YT_feed") and entry.is_dir()]
+            except FileNotFoundError:
+                self._yt_feed_dirs = []
+        return self._yt_feed_dirs
         
     def ensure_current_directories(self):
         """Ensure current directories exist, stripping duration suffixes if present."""
-        # Check if we have a renamed YT_feed directory
-        video_parent = self.config.base_video_dir.parent
-        renamed_dirs = list(video_parent.glob("YT_feed -*"))
-        
-        if renamed_dirs:
-            # Sort by modification time to get the most recent one
-            latest_dir = max(renamed_dirs, key=lambda x: x.stat().st_mtime)
-            
-            # If base directory doesn't exist, rename the latest one to it
-            if not self.config.base_video_dir.exists():
+        # Only look for a renamed YT_feed directory when the base one is missing;
+        # in the common case this avoids listing the whole Videos folder
+        if not self.config.base_video_dir.exists():
+            video_parent = self.config.base_video_dir.parent
+            renamed_dirs = list(video_parent.glob("YT_feed -*"))
+            
+            if renamed_dirs:
+                # Sort by modification time to get the most recent one
+                latest_dir = max(renamed_dirs, key=lambda x: x.stat().st_mtime)
+                
                 try:
                     latest_dir.rename(self.config.base_video_dir)
-                    self.logger.info(f"📁 Renamed {latest_dir.name} back to {self.config.base_video_dir.name}")
+                    self.logger.info("📁 Renamed %s back to %s", latest_dir.name, self.config.base_video_dir.name)
                 except OSError as e:
-                    self.logger.error(f"❌ Error renaming directory: {e}")
+                    self.logger.error("❌ Error renaming directory: %s", e)
         
         self.config.current_video_dir.mkdir(parents=True, exist_ok=True)
         self.config.current_audio_dir.mkdir(parents=True, exist_ok=True)
         self.config.current_playlist_dir.mkdir(parents=True, exist_ok=True)
         self.config.current_podcast_dir.mkdir(parents=True, exist_ok=True)
+        # Directories may have been renamed or created above
+        self._yt_feed_dirs = None
         
     def setup_logging(self) -> None:
         """Configure file logging with rotation."""
@@ -314,11 +806,11 @@ class YouTubeFeedDownloader:
         self.logger.info("🎬 YouTube Feed Downloader Started - Fixed Discovery Logic")
 
     def load_channel_history(self) -> None:
-        """Load channel history that tracks ALL downloaded videos per channel."""
+        """Load the channel history index; per-channel video lists are loaded on demand."""
         try:
             if self.config.channel_history_path.exists():
-                with open(self.config.channel_history_path, 'r', encoding='utf-8') as f:
-                    self.channel_history = json.load(f)
+                self.channel_history = load_json_file(self.config.channel_history_path)
+                self._migrate_channel_history()
             else:
                 self.channel_history = {
                     "channels": {},
@@ -328,85 +820,195 @@ class YouTubeFeedDownloader:
                 self.save_channel_history()
                 
         except (json.JSONDecodeError, IOError, UnicodeDecodeError) as e:
-            self.logger.error(f"❌ Error loading channel history: {e}")
+            self.logger.error("❌ Error loading channel history: %s", e)
             self.channel_history = {
                 "channels": {},
                 "last_updated": datetime.now().isoformat(),
                 "first_run_completed": False
             }
             self.save_channel_history()
+        
+        # Hoist hot lookups out of the per-video checks
+        self._channels_index = self.channel_history.setdefault("channels", {})
+        self._first_run = not self.channel_history.get("first_run_completed", False)
+
+    def _migrate_channel_history(self) -> None:
+        """Move legacy inline video lists out of the index into per-channel files."""
+        for handle, channel_data in self.channel_history.get("channels", {}).items():
+            downloaded = channel_data.pop("downloaded_videos", None)
+            if downloaded is None:
+                continue
+            if isinstance(downloaded, list):
+                downloaded = {
+                    video["id"]: {k: v for k, v in video.items() if k != "id"}
+                    for video in downloaded if "id" in video
+                }
+            channel_data["file"] = self._channel_file_name(handle)
+            channel_data["video_count"] = len(downloaded)
+            self._cache_channel(handle, {"handle": handle, "downloaded_videos": downloaded})
+            self._dirty_channels.add(handle)
+            self._history_dirty = True
+        if self._history_dirty:
+            self.save_channel_history()
+
+    @staticmethod
+    def _channel_file_name(channel_handle: str) -> str:
+        """Build a filesystem-safe, collision-free file name for a channel's history."""
+        safe = HANDLE_UNSAFE_REGEX.sub('_', channel_handle)[:80]
+        digest = hashlib.sha1(channel_handle.encode('utf-8')).hexdigest()[:10]
+        return f"{safe}-{digest}.json"
+
+    def _cache_channel(self, channel_handle: str, data: Dict[str, Any]) -> None:
+        """Add a channel's history to the LRU cache, writing out any evicted dirty entry."""
+        self._channel_cache[channel_handle] = data
+        self._channel_cache.move_to_end(channel_handle)
+        while len(self._channel_cache) > self.CHANNEL_CACHE_SIZE:
+            evicted, evicted_data = self._channel_cache.popitem(last=False)
+            if evicted in self._dirty_channels:
+                self._save_channel_file(evicted, evicted_data)
+                self._dirty_channels.discard(evicted)
+
+    def _get_channel_data(self, channel_handle: str, create: bool = False) -> Optional[Dict[str, Any]]:
+        """Return a channel's history, loading its file on first access.
+
+        A file that can't be read raises without caching anything, so it is never
+        overwritten with an empty history; an unparsable one is moved aside first.
+        """
+        data = self._channel_cache.get(channel_handle)
+        if data is not None:
+            self._channel_cache.move_to_end(channel_handle)
+            return data
+        
+        channels = self._channels_index
+        entry = channels.get(channel_handle)
+        if entry is None:
+            if not create:
+                return None
+            entry = channels[channel_handle] = {
+                "file": self._channel_file_name(channel_handle),
+                "video_count": 0
+            }
+            self._history_dirty = True
+        
+        data = {"handle": channel_handle, "downloaded_videos": {}}
+        channel_file = self.config.channel_history_dir / entry.get("file", self._channel_file_name(channel_handle))
+        try:
+            if channel_file.exists():
+                data = load_json_file(channel_file)
+                data.setdefault("downloaded_videos", {})
+        except IOError as e:
+            self.logger.error("❌ Error loading history for %s: %s", channel_handle, e)
+            raise
+        except (json.JSONDecodeError, UnicodeDecodeError, ValueError, AttributeError) as e:
+            # Keep the damaged file for inspection; the channel starts over with an empty history
+            corrupt_file = channel_file.with_name(f"{channel_file.name}.corrupt-{int(time.time())}")
+            channel_file.rename(corrupt_file)
+            self.logger.error("❌ Corrupt history for %s moved to %s: %s", channel_handle, corrupt_file.name, e)
+            data = {"handle": channel_handle, "downloaded_videos": {}}
+        self._cache_channel(channel_handle, data)
+        return data
+
+    def _save_channel_file(self, channel_handle: str, data: Dict[str, Any]) -> None:
+        """Write one channel's history file."""
+        entry = self._channels_index.get(channel_handle, {})
+        file_name = entry.get("file") or self._channel_file_name(channel_handle)
+        try:
+            self.config.channel_history_dir.mkdir(parents=True, exist_ok=True)
+            save_json_file(self.config.channel_history_dir / file_name, data, indent=False)
+        except IOError as e:
+            self.logger.error("❌ Error saving history for %s: %s", channel_handle, e)
 
     def save_channel_history(self) -> None:
-        """Save channel history to disk."""
+        """Save changed channel files and the history index to disk."""
         try:
+            for handle in list(self._dirty_channels):
+                data = self._channel_cache.get(handle)
+                if data is not None:
+                    self._save_channel_file(handle, data)
+            self._dirty_channels.clear()
             self.channel_history["last_updated"] = datetime.now().isoformat()
-            with open(self.config.channel_history_path, 'w', encoding='utf-8') as f:
-                json.dump(self.channel_history, f, indent=2, ensure_ascii=False)
+            save_json_file(self.config.channel_history_path, self.channel_history)
+            self._history_dirty = False
             self.logger.debug("💾 Saved channel history")
         except IOError as e:
-            self.logger.error(f"❌ Error saving channel history: {e}")
+            self.logger.error("❌ Error saving channel history: %s", e)
+        self._history_last_flush = time.monotonic()
+
+    def _flush_history(self) -> None:
+        """Write channel history if there are unsaved updates."""
+        if self._history_dirty:
+            self.save_channel_history()
 
     def mark_first_run_completed(self) -> None:
         """Mark that the first run has been completed."""
         self.channel_history["first_run_completed"] = True
+        self._first_run = False
         self.save_channel_history()
 
     def is_first_run(self) -> bool:
         """Check if this is the first run (no channel history)."""
-        return not self.channel_history.get("first_run_completed", False)
+        return self._first_run
+
+    def update_channel_history(self, channel_handle: str, video_info: Dict[str, Any], now_iso: Optional[str] = None) -> None:
+        """Update channel history with a new downloaded video.
 
-    def update_channel_history(self, channel_handle: str, video_info: Dict[str, Any]) -> None:
-        """Update channel history with a new downloaded video."""
+        Batch callers can pass a shared now_iso timestamp instead of formatting one per video.
+        """
         try:
-            if "channels" not in self.channel_history:
-                self.channel_history["channels"] = {}
-                
-            if channel_handle not in self.channel_history["channels"]:
-                self.channel_history["channels"][channel_handle] = {
-                    "downloaded_videos": [],
-                    "last_download": datetime.now().isoformat()
-                }
+            if now_iso is None:
+                now_iso = datetime.now().isoformat()
+            channel_data = self._get_channel_data(channel_handle, create=True)
             
             # Add video to history if not already there
             video_id = video_info["id"]
-            existing_ids = [v["id"] for v in self.channel_history["channels"][channel_handle]["downloaded_videos"]]
+            downloaded_videos = channel_data["downloaded_videos"]
             
-            if video_id not in existing_ids:
-                self.channel_history["channels"][channel_handle]["downloaded_videos"].append({
-                    "id": video_id,
+            if video_id not in downloaded_videos:
+                downloaded_videos[video_id] = {
                     "title": video_info.get("title", "Unknown"),
                     "url": video_info.get("url", ""),
-                    "downloaded_at": datetime.now().isoformat()
-                })
+                    "downloaded_at": now_iso
+                }
                 
-                # Keep only the last 1000 videos to prevent file from growing too large
-                if len(self.channel_history["channels"][channel_handle]["downloaded_videos"]) > 1000:
-                    self.channel_history["channels"][channel_handle]["downloaded_videos"] = \
-                        self.channel_history["channels"][channel_handle]["downloaded_videos"][-1000:]
+                # Keep only the last 1000 videos to prevent file from growing too large;
+                # dicts keep insertion order, so the first key is the oldest entry
+                if len(downloaded_videos) > 1000:
+                    del downloaded_videos[next(iter(downloaded_videos))]
                 
-                self.channel_history["channels"][channel_handle]["last_download"] = datetime.now().isoformat()
-                self.save_channel_history()
+                entry = self._channels_index[channel_handle]
+                entry["last_download"] = now_iso
+                entry["video_count"] = len(downloaded_videos)
+                self._dirty_channels.add(channel_handle)
+                self._history_dirty = True
+                if time.monotonic() - self._history_last_flush > self.STATE_FLUSH_INTERVAL:
+                    self.save_channel_history()
                 
         except Exception as e:
-            self.logger.warning(f"⚠️ Could not update channel history: {e}")
+            self.logger.warning("⚠️ Could not update channel history: %s", e)
 
     def is_video_downloaded(self, channel_handle: str, video_id: str) -> bool:
         """Check if a video has already been downloaded for a channel."""
         try:
-            if (channel_handle in self.channel_history.get("channels", {}) and
-                any(video["id"] == video_id for video in self.channel_history["channels"][channel_handle].get("downloaded_videos", []))):
-                return True
-            return False
+            channel_data = self._get_channel_data(channel_handle)
+            return channel_data is not None and video_id in channel_data["downloaded_videos"]
         except Exception as e:
-            self.logger.warning(f"⚠️ Error checking video download status: {e}")
+            self.logger.warning("⚠️ Error checking video download status: %s", e)
             return False
 
+    def get_downloaded_ids(self, channel_handle: str) -> Dict[str, Any]:
+        """Return the id-keyed downloaded videos of a channel for repeated membership checks."""
+        try:
+            channel_data = self._get_channel_data(channel_handle)
+            return channel_data["downloaded_videos"] if channel_data is not None else {}
+        except Exception as e:
+            self.logger.warning("⚠️ Error loading downloaded videos for %s: %s", channel_handle, e)
+            return {}
+
     def load_resume_state(self) -> None:
         """Load resume state from disk and clean up old entries."""
         try:
             if self.config.resume_state_path.exists():
-                with open(self.config.resume_state_path, 'r', encoding='utf-8') as f:
-                    self.resume_state = json.load(f)
+                self.resume_state = load_json_file(self.config.resume_state_path)
                 
                 # Clean up old resume entries (older than 7 days)
                 self.cleanup_old_resume_entries()
@@ -416,25 +1018,41 @@ class YouTubeFeedDownloader:
                     "playlists": {},
                     "last_cleanup": datetime.now().isoformat()
                 }
-                self.save_resume_state()
+                self._resume_dirty = True
                 
         except (json.JSONDecodeError, IOError, UnicodeDecodeError) as e:
-            self.logger.error(f"❌ Error loading resume state: {e}")
+            self.logger.error("❌ Error loading resume state: %s", e)
             self.resume_state = {
                 "videos": {},
                 "playlists": {},
                 "last_cleanup": datetime.now().isoformat()
             }
-            self.save_resume_state()
+            self._resume_dirty = True
 
     def save_resume_state(self) -> None:
         """Save resume state to disk."""
-        try:
-            with open(self.config.resume_state_path, 'w', encoding='utf-8') as f:
-                json.dump(self.resume_state, f, indent=2, ensure_ascii=False)
-            self.logger.debug("💾 Saved resume state")
-        except IOError as e:
-            self.logger.error(f"❌ Error saving resume state: {e}")
+        with self._resume_lock:
+            try:
+                save_json_file(self.config.resume_state_path, self.resume_state)
+                self._resume_dirty = False
+                self.logger.debug("💾 Saved resume state")
+            except IOError as e:
+                self.logger.error("❌ Error saving resume state: %s", e)
+            self._resume_last_flush = time.monotonic()
+
+    def _flush_resume_state(self) -> None:
+        """Write resume state if there are unsaved updates."""
+        if self._resume_dirty:
+            self.save_resume_state()
+
+    def _resume_state_changed(self) -> None:
+        """Mark resume state dirty; it is written at most every STATE_FLUSH_INTERVAL.
+
+        Call with _resume_lock held, in the same block as the change itself.
+        """
+        self._resume_dirty = True
+        if time.monotonic() - self._resume_last_flush > self.STATE_FLUSH_INTERVAL:
+            self.save_resume_state()
 
     def cleanup_old_resume_entries(self) -> None:
         """Clean up resume entries older than 7 days."""
@@ -459,29 +1077,31 @@ class YouTubeFeedDownloader:
                     cleaned_count += 1
             
             if cleaned_count > 0:
-                self.logger.info(f"🧹 Cleaned up {cleaned_count} old resume entries")
-                self.save_resume_state()
+                self.logger.info("🧹 Cleaned up %s old resume entries", cleaned_count)
+                self._resume_dirty = True
                 
         except Exception as e:
-            self.logger.error(f"❌ Error cleaning up old resume entries: {e}")
+            self.logger.error("❌ Error cleaning up old resume entries: %s", e)
 
     def update_resume_state(self, item_type: str, item_id: str, data: Dict[str, Any]) -> None:
         """Update resume state for an item."""
         try:
-            if item_type == "video":
-                self.resume_state["videos"][item_id] = {
-                    **data,
-                    "timestamp": datetime.now().isoformat()
-                }
-            elif item_type == "playlist":
-                self.resume_state["playlists"][item_id] = {
-                    **data,
-                    "timestamp": datetime.now().isoformat()
-                }
-            
-            self.save_resume_state()
+            now_iso = datetime.now().isoformat()
+            with self._resume_lock:
+                if item_type == "video":
+                    self.resume_state["videos"][item_id] = {
+                        **data,
+                        "timestamp": now_iso
+                    }
+                elif item_type == "playlist":
+                    self.resume_state["playlists"][item_id] = {
+                        **data,
+                        "timestamp": now_iso
+                    }
+                
+                self._resume_state_changed()
         except Exception as e:
-            self.logger.warning(f"⚠️ Could not update resume state: {e}")
+            self.logger.warning("⚠️ Could not update resume state: %s", e)
 
     def get_resume_state(self, item_type: str, item_id: str) -> Optional[Dict[str, Any]]:
         """Get resume state for an item."""
@@ -491,20 +1111,23 @@ class YouTubeFeedDownloader:
             elif item_type == "playlist":
                 return self.resume_state["playlists"].get(item_id)
         except Exception as e:
-            self.logger.warning(f"⚠️ Could not get resume state: {e}")
+            self.logger.warning("⚠️ Could not get resume state: %s", e)
         return None
 
     def clear_resume_state(self, item_type: str, item_id: str) -> None:
         """Clear resume state for an item (when download completes)."""
         try:
-            if item_type == "video" and item_id in self.resume_state["videos"]:
-                del self.resume_state["videos"][item_id]
-            elif item_type == "playlist" and item_id in self.resume_state["playlists"]:
-                del self.resume_state["playlists"][item_id]
-            
-            self.save_resume_state()
+            with self._resume_lock:
+                if item_type == "video" and item_id in self.resume_state["videos"]:
+                    del self.resume_state["videos"][item_id]
+                elif item_type == "playlist" and item_id in self.resume_state["playlists"]:
+                    del self.resume_state["playlists"][item_id]
+                else:
+                    return
+                
+                self._resume_state_changed()
         except Exception as e:
-            self.logger.warning(f"⚠️ Could not clear resume state: {e}")
+            self.logger.warning("⚠️ Could not clear resume state: %s", e)
 
     def get_default_channels(self):
         """Get default channels (cleaned for public release)."""
@@ -522,36 +1145,45 @@ class YouTubeFeedDownloader:
         """Load configuration from file and sync with script defaults."""
         try:
             if self.config.config_path.exists():
-                with open(self.config.config_path, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
-                    
-                    file_channels = config_data.get("channels", {})
-                    file_playlists = config_data.get("playlists", {})
-                    
-                    default_channels = self.get_default_channels()
-                    default_playlists = self.get_default_playlists()
-                    
-                    merged_channels = {**default_channels, **file_channels}
-                    merged_playlists = {**default_playlists, **file_playlists}
-                    
-                    self.channels = merged_channels
-                    self.playlists = merged_playlists
-                    
-                    # Load settings
-                    self.config.ask_initial_videos = config_data.get("ask_initial_videos", True)
-                    self.config.initial_videos_per_channel = config_data.get("initial_videos_per_channel", 5)
-                    self.config.max_videos_per_channel = config_data.get("max_videos_per_channel", 100)
-                    self.config.max_resolution = config_data.get("max_resolution", "720")
-                    
-                    if (file_channels != merged_channels or file_playlists != merged_playlists):
-                        self.save_config()
+                config_data = load_json_file(self.config.config_path)
+                
+                file_channels = config_data.get("channels", {})
+                file_playlists = config_data.get("playlists", {})
+                
+                default_channels = self.get_default_channels()
+                default_playlists = self.get_default_playlists()
+                
+                merged_channels = {**default_channels, **file_channels}
+                merged_playlists = {**default_playlists, **file_playlists}
+                
+                self.channels = merged_channels
+                self.playlists = merged_playlists
+                
+                # Load settings
+                self.config.ask_initial_videos = config_data.get("ask_initial_videos", True)
+                self.config.initial_videos_per_channel = config_data.get("initial_videos_per_channel", 5)
+                self.config.max_videos_per_channel = config_data.get("max_videos_per_channel", 100)
+                self.config.max_resolution = config_data.get("max_resolution", "720")
+                # Clamped to the settings menu range; earlier auto-tuning could write values above it
+                _, _, _, parallel_min, parallel_max = self._NUMERIC_SETTINGS["1"]
+                self.config.max_parallel_downloads = min(max(
+                    config_data.get("max_parallel_downloads", self.config.max_parallel_downloads), parallel_min), parallel_max)
+                self.config.auto_tune_parallel_downloads = config_data.get("auto_tune_parallel_downloads", False)
+                self.config.tuned_parallel_downloads = config_data.get("tuned_parallel_downloads", 0)
+                self.config.max_auto_parallel_downloads = config_data.get("max_auto_parallel_downloads", self.config.max_auto_parallel_downloads)
+                self.config.last_download_speed = config_data.get("last_download_speed", 0.0)
+                self.config.min_recheck_seconds = config_data.get("min_recheck_seconds", 0)
+                self.config.in_process_listings = config_data.get("in_process_listings", False)
+                
+                if (file_channels != merged_channels or file_playlists != merged_playlists):
+                    self.save_config()
             else:
                 self.channels = self.get_default_channels()
                 self.playlists = self.get_default_playlists()
                 self.save_config()
                 
         except (json.JSONDecodeError, IOError, UnicodeDecodeError) as e:
-            self.logger.error(f"❌ Error loading config: {e}")
+            self.logger.error("❌ Error loading config: %s", e)
             self.channels = self.get_default_channels()
             self.playlists = self.get_default_playlists()
             self.save_config()
@@ -565,55 +1197,76 @@ class YouTubeFeedDownloader:
                 "ask_initial_videos": self.config.ask_initial_videos,
                 "initial_videos_per_channel": self.config.initial_videos_per_channel,
                 "max_videos_per_channel": self.config.max_videos_per_channel,
-                "max_resolution": self.config.max_resolution
+                "max_resolution": self.config.max_resolution,
+                "max_parallel_downloads": self.config.max_parallel_downloads,
+                "auto_tune_parallel_downloads": self.config.auto_tune_parallel_downloads,
+                "max_auto_parallel_downloads": self.config.max_auto_parallel_downloads,
+                "last_download_speed": self.config.last_download_speed,
+                "tuned_parallel_downloads": self.config.tuned_parallel_downloads,
+                "min_recheck_seconds": self.config.min_recheck_seconds,
+                "in_process_listings": self.config.in_process_listings
             }
-            with open(self.config.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            save_json_file(self.config.config_path, config_data)
             self.logger.debug("💾 Saved configuration")
         except IOError as e:
-            self.logger.error(f"❌ Error saving config: {e}")
+            self.logger.error("❌ Error saving config: %s", e)
     
     def load_download_history(self) -> None:
         """Load the download history from disk."""
         try:
             if self.config.download_log_path.exists():
-                with open(self.config.download_log_path, 'r', encoding='utf-8') as f:
-                    self.download_history = json.load(f)
+                self.download_history = load_json_file(self.config.download_log_path)
             else:
                 self.download_history = {"channels": {}, "playlists": {}}
                 self.save_download_history()
             
             if self.config.last_download_path.exists():
-                with open(self.config.last_download_path, 'r', encoding='utf-8') as f:
-                    self.last_download = json.load(f)
+                self.last_download = load_json_file(self.config.last_download_path)
             else:
                 self.last_download = {}
                 
         except (json.JSONDecodeError, IOError, UnicodeDecodeError) as e:
-            self.logger.error(f"❌ Error loading history: {e}")
+            self.logger.error("❌ Error loading history: %s", e)
             self.download_history = {"channels": {}, "playlists": {}}
             self.last_download = {}
     
     def save_download_history(self) -> None:
         """Save the download history to disk."""
         try:
-            with open(self.config.download_log_path, 'w', encoding='utf-8') as f:
-                json.dump(self.download_history, f, indent=2, ensure_ascii=False)
+            save_json_file(self.config.download_log_path, self.download_history)
             self.logger.debug("💾 Saved download history")
         except IOError as e:
-            self.logger.error(f"❌ Error saving download history: {e}")
+            self.logger.error("❌ Error saving download history: %s", e)
     
     def save_last_download(self, info: Dict[str, Any]) -> None:
-        """Save information about the last download."""
-        try:
+        """Record the last download; the file is rewritten at most every STATE_FLUSH_INTERVAL."""
+        with self._last_download_lock:
             self.last_download = {
                 **info,
                 "timestamp": datetime.now().isoformat()
             }
-            with open(self.config.last_download_path, 'w', encoding='utf-8') as f:
-                json.dump(self.last_download, f, indent=2, ensure_ascii=False)
-        except IOError as e:
-            self.logger.warning(f"⚠️ Could not save last download info: {e}")
+            self._last_download_dirty = True
+            if time.monotonic() - self._last_download_last_flush > self.STATE_FLUSH_INTERVAL:
+                self._flush_last_download()
+    
+    def _flush_last_download(self) -> None:
+        """Write the last download info if it changed since the last write."""
+        with self._last_download_lock:
+            if not self._last_download_dirty:
+                return
+            try:
+                save_json_file(self.config.last_download_path, self.last_download)
+                self._last_download_dirty = False
+            except IOError as e:
+                self.logger.warning("⚠️ Could not save last download info: %s", e)
+            self._last_download_last_flush = time.monotonic()
+    
+    def flush_state(self) -> None:
+        """Write every pending debounced state file now, for exits that bypass atexit."""
+        self._flush_history()
+        self._flush_resume_state()
+        self._flush_last_download()
+        self.config.duration_cache.save()
     
     def format_duration(self, seconds: int) -> str:
         """Format duration in seconds to HH:MM:SS or MM:SS."""
@@ -639,67 +1292,199 @@ class YouTubeFeedDownloader:
         
         try:
             # Round seconds to nearest whole number
-            seconds = round(float(seconds))
-            
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            remaining_seconds = seconds % 60
-            
-            if hours > 0:
-                if minutes > 0:
-                    return f"{hours}hr {minutes}min"
-                else:
-                    return f"{hours}hr"
-            elif minutes > 0:
-                if remaining_seconds > 0:
-                    return f"{minutes}min {remaining_seconds}sec"
-                else:
-                    return f"{minutes}min"
-            else:
-                return f"{remaining_seconds}sec"
+            return format_whole_duration_short(round(float(seconds)))
         except (TypeError, ValueError):
             return "Unknown"
     
-    # Regex for matching duration suffixes like "-28hr 17min", "-28.5hr", "-45sec"
-    DURATION_REGEX = re.compile(r'\s*-\s*\d+(\.\d+)?(?:hr|min|sec|h|m|s)(?:\s*\d+(\.\d+)?(?:min|sec|m|s))?$', re.IGNORECASE)
+    def _read_duration(self, file_path: Path) -> Tuple[Path, Optional[float]]:
+        """Read a file's duration in-process with mutagen. Returns (file_path, seconds or None)."""
+        try:
+            media = load_optional_module("mutagen").File(str(file_path))
+            if media is not None and media.info is not None and media.info.length:
+                return file_path, float(media.info.length)
+        except Exception:
+            pass
+        return file_path, None
 
-    def calculate_directory_duration(self, directory: Path) -> Tuple[float, str, str]:
-        """Calculate total duration of all media files in a directory."""
+    def _probe_duration(self, file_path: Path) -> Tuple[Path, Optional[float]]:
+        """Read the duration of a single media file with ffprobe. Returns (file_path, seconds or None)."""
         try:
-            media_extensions = ['*.mp3', '*.wav', '*.flac', '*.aac', '*.ogg', '*.m4a', 
-                               '*.mp4', '*.mkv', '*.avi', '*.mov', '*.flv', '*.webm']
-            
-            total_seconds = 0.0
-            file_count = 0
-            
-            for extension in media_extensions:
-                for file_path in directory.rglob(extension):
-                    # Check cache first
-                    cached_duration = self.config.duration_cache.get(file_path)
-                    if cached_duration is not None:
-                        total_seconds += cached_duration
-                        file_count += 1
-                        continue
+            cmd = [
+                'ffprobe', '-v', 'quiet', '-show_entries', 
+                'format=duration', '-of', 
+                'default=noprint_wrappers=1:nokey=1', str(file_path)
+            ]
+            # Only stdout is piped, so no stderr drain is needed alongside it
+            result = subprocess.run(spawn_command(cmd), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                    text=True, check=True, timeout=30, close_fds=False)
+            duration_str = result.stdout.strip()
+            if duration_str:
+                return file_path, float(duration_str)
+        except (subprocess.CalledProcessError, ValueError, FileNotFoundError, subprocess.TimeoutExpired):
+            pass
+        return file_path, None
 
-                    try:
-                        cmd = [
-                            'ffprobe', '-v', 'quiet', '-show_entries', 
-                            'format=duration', '-of', 
-                            'default=noprint_wrappers=1:nokey=1', str(file_path)
-                        ]
-                        result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
-                        duration_str = result.stdout.strip()
-                        if duration_str:
-                            duration = float(duration_str)
-                            self.config.duration_cache.set(file_path, duration) # Update cache
-                            total_seconds += duration
-                            file_count += 1
-                    except (subprocess.CalledProcessError, ValueError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-                        # self.logger.warning(f"⚠️ Could not get duration for {file_path}: {e}")
-                        continue
+    def _probe_duration_batch(self, file_paths: List[Path]) -> Dict[Path, float]:
+        """Read the durations of several files with a single ffmpeg process.
+
+        ffprobe only accepts one input, but ffmpeg prints an "Input #N" header with a
+        Duration line for every -i it opens. Files it could not report are left out.
+        """
+        cmd = ['ffmpeg', '-hide_banner', '-nostdin']
+        for file_path in file_paths:
+            cmd += ['-i', f"file:{file_path}"]
+        try:
+            # No output file is given, so ffmpeg exits non-zero after printing the input info
+            result = subprocess.run(spawn_command(cmd), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                    timeout=30 + len(file_paths), close_fds=False)
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return {}
+        
+        durations = {}
+        current = None
+        for line in result.stderr.decode('utf-8', errors='replace').splitlines():
+            input_match = FFMPEG_INPUT_REGEX.match(line)
+            if input_match:
+                current = int(input_match.group(1))
+                continue
+            duration_match = FFMPEG_DURATION_REGEX.match(line)
+            if duration_match and current is not None and current < len(file_paths):
+                hours, minutes, seconds = duration_match.groups()
+                durations[file_paths[current]] = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+                current = None
+        return durations
+
+    def _probe_durations(self, file_paths: List[Path]) -> Iterator[Tuple[Path, float]]:
+        """Yield (file_path, seconds) for every file whose duration could be read.
+
+        Tries mutagen in-process first for the containers it understands, then one
+        ffmpeg run per PROBE_BATCH_SIZE files, and only falls back to a per-file
+        ffprobe for whatever is still unknown.
+        """
+        remaining = file_paths
+        if load_optional_module("mutagen") is not None:
+            remaining = []
+            readable = []
+            for file_path in file_paths:
+                if file_path.suffix.lower() in MUTAGEN_EXTENSIONS:
+                    readable.append(file_path)
+                else:
+                    remaining.append(file_path)
+            if readable:
+                # mutagen mostly waits on file reads, so these aren't limited to the core count
+                with ThreadPoolExecutor(max_workers=min(self.config.max_parallel_probes, len(readable))) as executor:
+                    for file_path, duration in executor.map(self._read_duration, readable):
+                        if duration is None:
+                            remaining.append(file_path)
+                        else:
+                            yield file_path, duration
+        if not remaining:
+            return
+        
+        # ffmpeg header parsing is CPU-bound, so more processes than cores only adds contention
+        max_workers = min(self.config.max_parallel_probes, os.cpu_count() or 1, len(remaining))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            batches = [remaining[i:i + self.PROBE_BATCH_SIZE]
+                       for i in range(0, len(remaining), self.PROBE_BATCH_SIZE)]
+            leftovers = []
+            for batch, durations in zip(batches, executor.map(self._probe_duration_batch, batches)):
+                for file_path in batch:
+                    duration = durations.get(file_path)
+                    if duration is None:
+                        leftovers.append(file_path)
+                    else:
+                        yield file_path, duration
             
-            # Save cache after processing directory
-            self.config.duration_cache.save()
+            for file_path, duration in executor.map(self._probe_duration, leftovers):
+                if duration is not None:
+                    yield file_path, duration
+
+    def _iter_media_files(self, directory: Union[str, Path]) -> Iterator[os.DirEntry]:
+        """Yield os.DirEntry objects for media files under directory in a single tree walk."""
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from self._iter_media_files(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in MEDIA_EXTENSIONS and entry.is_file():
+                        yield entry
+        except OSError:
+            return
+
+    def _directory_signature(self, directory: Union[str, Path]) -> Tuple[int, int]:
+        """Return (newest directory mtime_ns in the tree, media file count) without stat-ing files.
+
+        Adding, removing or renaming a file bumps its parent directory's mtime, so an
+        unchanged signature means the tree's aggregate duration is still valid.
+        """
+        newest = os.stat(directory).st_mtime_ns
+        count = 0
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        sub_newest, sub_count = self._directory_signature(entry.path)
+                        newest = max(newest, sub_newest)
+                        count += sub_count
+                    elif os.path.splitext(entry.name)[1].lower() in MEDIA_EXTENSIONS:
+                        count += 1
+        except OSError:
+            pass
+        return newest, count
+
+    def _sum_media_durations(self, directory: Path) -> Tuple[float, int, int]:
+        """Total the durations of all media files under directory.
+
+        Returns (seconds, file_count, unprobed_count), where unprobed_count is the number
+        of files whose duration could not be read and so are missing from the total.
+        """
+        total_seconds = 0.0
+        file_count = 0
+        uncached_files = []
+        
+        for entry in self._iter_media_files(directory):
+            file_path = Path(entry.path)
+            # One stat per file, shared by the cache lookup and the cache update
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            # Check cache first
+            cached_duration = self.config.duration_cache.get(file_path, stat)
+            if cached_duration is not None:
+                total_seconds += cached_duration
+                file_count += 1
+            else:
+                uncached_files.append((file_path, stat))
+        
+        # Probe cache misses, batching the ones that need an external process
+        unprobed_count = 0
+        if uncached_files:
+            stats = dict(uncached_files)
+            probed_count = 0
+            for file_path, duration in self._probe_durations(list(stats)):
+                self.config.duration_cache.set(file_path, duration, stats[file_path]) # Update cache
+                self.config.duration_cache.flush_if_due()
+                total_seconds += duration
+                file_count += 1
+                probed_count += 1
+            unprobed_count = len(stats) - probed_count
+        
+        return total_seconds, file_count, unprobed_count
+
+    def calculate_directory_duration(self, directory: Path) -> Tuple[float, str, str]:
+        """Calculate total duration of all media files in a directory."""
+        try:
+            signature = self._directory_signature(directory)
+            cached = self.config.duration_cache.get_dir(directory, signature)
+            if cached is not None:
+                total_seconds, file_count = cached
+            else:
+                total_seconds, file_count, unprobed_count = self._sum_media_durations(directory)
+                # A partial total would stick until the tree changes, so only complete ones are
+                # cached; the unreadable files get probed again next time (e.g. still being written)
+                if not unprobed_count:
+                    self.config.duration_cache.set_dir(directory, signature, total_seconds, file_count)
             
             if file_count == 0:
                 return 0.0, "0sec", "No media files"
@@ -707,7 +1492,7 @@ class YouTubeFeedDownloader:
             return total_seconds, self.format_duration_short(total_seconds), f"{file_count} files"
             
         except Exception as e:
-            self.logger.error(f"❌ Error calculating directory duration: {e}")
+            self.logger.error("❌ Error calculating directory duration: %s", e)
             return 0.0, "Error", "Error"
     
     def rename_directory_with_duration(self, directory: Path, base_name: str) -> Tuple[Path, float, str]:
@@ -718,11 +1503,8 @@ class YouTubeFeedDownloader:
             
             total_seconds, duration_short, file_info = self.calculate_directory_duration(directory)
             
-            clean_base = self.DURATION_REGEX.sub('', base_name).strip()
-            # Clean up old formatting remnants if any
-            clean_base = re.sub(r'\s*-\s*\d+[hmr]\s*\d*[ms]?in?$', '', clean_base)
-            clean_base = re.sub(r'\s*-\s*\d+sec$', '', clean_base)
-            clean_base = re.sub(r'\s*-\s*\d+\.\d+sec$', '', clean_base)
+            # Strip the current suffix, then any old formatting remnant
+            clean_base = LEGACY_DURATION_REGEX.sub('', DURATION_REGEX.sub('', base_name).strip())
             
             if total_seconds > 0:
                 new_name = f"{clean_base} -{duration_short}"
@@ -731,19 +1513,20 @@ class YouTubeFeedDownloader:
             
             new_path = directory.parent / new_name
             
-            if new_path != directory and not new_path.exists():
-                try:
-                    directory.rename(new_path)
-                    return new_path, total_seconds, duration_short
-                except OSError:
-                    return directory, total_seconds, duration_short
-            elif new_path.exists() and new_path != directory:
-                return new_path, total_seconds, duration_short
+            if new_path == directory:
+                return directory, total_seconds, duration_short
             
-            return directory, total_seconds, duration_short
+            # Rename directly and let the kernel report an existing target, instead of stat-ing first
+            try:
+                os.rename(directory, new_path)
+                return new_path, total_seconds, duration_short
+            except OSError as e:
+                if e.errno in (errno.EEXIST, errno.ENOTEMPTY):
+                    return new_path, total_seconds, duration_short
+                return directory, total_seconds, duration_short
             
         except Exception as e:
-            self.logger.error(f"❌ Error renaming directory: {e}")
+            self.logger.error("❌ Error renaming directory: %s", e)
             return directory, 0.0, "Error"
             
     def update_directory_names(self):
@@ -779,67 +1562,108 @@ class YouTubeFeedDownloader:
                 
                         if p_seconds > 0:
                              playlist_node.add(f"📚 {new_playlist_dir.name}")
+        
+        # One cache write for the whole scan; other callers rely on the periodic and atexit flushes
+        self.config.duration_cache.save()
                 
         console.print(tree)
         console.print("")
     
+    def _run_streaming(self, cmd: List[str], timeout: float, text: bool = True) -> Iterator[Union[str, bytes]]:
+        """Yield a command's stdout lines as they arrive, enforcing an overall timeout.
+
+        With text=False the lines are raw bytes, for callers that parse them without decoding.
+
+        Raises subprocess.TimeoutExpired when the deadline passes and
+        subprocess.CalledProcessError (carrying stderr) on a non-zero exit.
+        Closing the generator early kills the process.
+        """
+        expired = []
+        with tempfile.TemporaryFile() as stderr_file:
+            # Own process group, so a kill also reaches any helper still holding the pipe open
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=text,
+                                       bufsize=8192, start_new_session=True)
+            with self._child_groups_lock:
+                self._child_groups.add(process.pid)
+            
+            def kill():
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except OSError:
+                    pass
+            
+            def expire():
+                expired.append(True)
+                kill()
+            
+            timer = threading.Timer(timeout, expire)
+            timer.daemon = True
+            timer.start()
+            try:
+                for line in process.stdout:
+                    yield line
+                returncode = process.wait()
+            finally:
+                timer.cancel()
+                if process.poll() is None:
+                    kill()
+                    process.wait()
+                process.stdout.close()
+                with self._child_groups_lock:
+                    self._child_groups.discard(process.pid)
+            
+            if expired:
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode('utf-8', errors='replace')
+                raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr)
+
+    def kill_child_processes(self) -> None:
+        """Kill the process groups of all running listing queries (used on interrupt)."""
+        with self._child_groups_lock:
+            groups = list(self._child_groups)
+        for pgid in groups:
+            try:
+                os.killpg(pgid, signal.SIGKILL)
+            except OSError:
+                pass
+
     def get_all_recent_videos(self, url: str, source_name: str, max_videos: int = 100, silent: bool = False) -> List[Dict[str, Any]]:
-        """Get all recent videos from a channel or playlist."""
-        videos = []
+        """Get all recent videos from a channel or playlist (LISTING_FAILED if every query failed)."""
+        first_run = self.is_first_run()
         for attempt in range(self.config.max_retries):
+            videos = []
             try:
-                cmd = [
-                    "yt-dlp",
-                    "--flat-playlist",
-                    "--playlist-items", f"1-{max_videos}",
-                    "--dump-json",
-                    "--no-warnings",
-                    url
-                ]
-                
                 if not silent:
-                    if self.is_first_run():
+                    if first_run:
                         print(f"🔍 Scanning {source_name} for recent videos...", end="", flush=True)
                     else:
                         print(f"🔍 Checking {source_name} for NEW videos...", end="", flush=True)
                 
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=self.config.query_timeout * 2,
-                    check=True
-                )
-                
-                if result.stdout.strip():
-                    lines = result.stdout.strip().split('\n')
-                    for line in lines:
-                        if line.strip():
-                            try:
-                                data = json.loads(line)
-                                video_id = data.get("id", "unknown")
-                                title = data.get("title", "Unknown")
-                                uploader = data.get("uploader", source_name)
-                                
-                                duration = data.get("duration", 0)
-                                if not duration or duration == 0:
-                                    duration = data.get("average_duration", 0)
-                                if not duration or duration == 0:
-                                    duration = 0
-                                
-                                videos.append({
-                                    "id": video_id,
-                                    "title": title,
-                                    "url": f"https://www.youtube.com/watch?v={video_id}",
-                                    "uploader": uploader,
-                                    "duration": duration,
-                                    "duration_formatted": self.format_duration(duration)
-                                })
-                            except json.JSONDecodeError:
-                                continue
+                for data in self._iter_listing_entries(url, max_videos):
+                    video_id = data.get("id", "unknown")
+                    title = data.get("title", "Unknown")
+                    uploader = data.get("uploader", source_name)
                     
+                    duration = data.get("duration", 0)
+                    if not duration or duration == 0:
+                        duration = data.get("average_duration", 0)
+                    if not duration or duration == 0:
+                        duration = 0
+                    
+                    videos.append({
+                        "id": video_id,
+                        "title": title,
+                        "url": f"https://www.youtube.com/watch?v={video_id}",
+                        "uploader": uploader,
+                        "duration": duration,
+                        "duration_formatted": self.format_duration(duration)
+                    })
+                
+                if videos:
                     if not silent:
-                        if self.is_first_run():
+                        if first_run:
                             print(f" ✅ Found {len(videos)} videos")
                         else:
                             print(f" ✅ Found {len(videos)} recent videos")
@@ -852,7 +1676,7 @@ class YouTubeFeedDownloader:
             except subprocess.TimeoutExpired:
                 if not silent:
                     print(f" ⏱️ Timeout")
-                self.logger.warning(f"⚠️ Query timeout for {source_name} (attempt {attempt + 1})")
+                self.logger.warning("⚠️ Query timeout for %s (attempt %s)", source_name, attempt + 1)
                 if attempt < self.config.max_retries - 1:
                     time.sleep(self.config.retry_delay)
                 continue
@@ -861,7 +1685,7 @@ class YouTubeFeedDownloader:
                 error_msg = e.stderr.strip() if e.stderr else "Unknown error"
                 if not silent:
                     print(f" ❌ Command failed")
-                self.logger.error(f"❌ Query command failed for {source_name}: {error_msg}")
+                self.logger.error("❌ Query command failed for %s: %s", source_name, error_msg)
                 
                 if attempt == self.config.max_retries - 1:
                     return self._fallback_recent_videos(url, source_name, max_videos, silent)
@@ -872,106 +1696,132 @@ class YouTubeFeedDownloader:
             except Exception as e:
                 if not silent:
                     print(f" ❌ Error: {str(e)[:50]}")
-                self.logger.error(f"❌ Query error for {source_name}: {e}")
+                self.logger.error("❌ Query error for %s: %s", source_name, e)
                 if attempt < self.config.max_retries - 1:
                     time.sleep(self.config.retry_delay)
                 continue
         
-        return []
+        return LISTING_FAILED
+
+    def _iter_listing_entries(self, url: str, max_videos: int) -> Iterator[Dict[str, Any]]:
+        """Yield the flat entries of the first max_videos items of a channel or playlist.
+
+        Both backends give up after query_timeout * 2 seconds with TimeoutExpired, and
+        extraction failures surface as CalledProcessError.
+        """
+        timeout = self.config.query_timeout * 2
+        yt_dlp = load_optional_module("yt_dlp") if self.config.in_process_listings else None
+        if yt_dlp is not None:
+            yield from self._extract_listing_in_process(yt_dlp, url, max_videos, timeout)
+            return
+        
+        cmd = [
+            "yt-dlp",
+            "--flat-playlist",
+            "--playlist-items", f"1-{max_videos}",
+            "--dump-json",
+            "--no-warnings",
+            url
+        ]
+        # Parse each JSON line as yt-dlp emits it instead of buffering the whole output;
+        # the bytes go straight to the parser without a separate decode pass
+        for line in self._run_streaming(cmd, timeout, text=False):
+            if line.strip():
+                try:
+                    yield loads_json(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def _extract_listing_in_process(self, yt_dlp: Any, url: str, max_videos: int, timeout: float) -> List[Dict[str, Any]]:
+        """List a source with the yt_dlp module, saving an interpreter start per query.
+
+        socket_timeout only bounds single requests, so the extraction runs on a daemon
+        thread joined with the overall deadline; a stalled one is abandoned, not waited on.
+        """
+        options = {
+            "extract_flat": "in_playlist",
+            "playlist_items": f"1-{max_videos}",
+            "quiet": True,
+            "no_warnings": True,
+            "socket_timeout": self.config.query_timeout,
+            "logger": YtDlpLogger(self.logger),
+        }
+        outcome = {}
+        
+        def extract():
+            try:
+                with yt_dlp.YoutubeDL(options) as ydl:
+                    outcome["info"] = ydl.extract_info(url, download=False)
+            except Exception as e:
+                outcome["error"] = e
+        
+        worker = threading.Thread(target=extract, daemon=True)
+        worker.start()
+        worker.join(timeout)
+        if worker.is_alive():
+            raise subprocess.TimeoutExpired(["yt_dlp", url], timeout)
+        error = outcome.get("error")
+        if isinstance(error, yt_dlp.DownloadError):
+            raise subprocess.CalledProcessError(1, ["yt_dlp", url], stderr=str(error))
+        if error is not None:
+            raise error
+        return (outcome.get("info") or {}).get("entries") or []
 
     def _fallback_recent_videos(self, url: str, source_name: str, limit: int, silent: bool = False) -> List[Dict[str, Any]]:
-        """Fallback method for getting recent videos when main method fails."""
+        """Fallback method for getting recent videos when main method fails.
+
+        Returns LISTING_FAILED when the fallback query also produced nothing.
+        """
         try:
-            self.logger.info(f"🔄 Trying fallback query for {source_name}")
+            self.logger.info("🔄 Trying fallback query for %s", source_name)
             
             videos = []
-            # Try to get videos one by one (slower but more reliable)
+            # One --print query for the whole range instead of one yt-dlp process per item
             max_videos = limit if self.is_first_run() else min(limit, 50)  # Limit to 50 for subsequent runs
-            for i in range(1, max_videos + 1):
-                try:
-                    cmd = [
-                        "yt-dlp",
-                        "--flat-playlist",
-                        "--playlist-items", str(i),
-                        "--print", "%(id)s\t%(title)s\t%(uploader)s\t%(duration)s",
-                        "--no-warnings",
-                        url
-                    ]
-                    
-                    result = subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=30,
-                        check=False
-                    )
-                    
-                    if result.returncode == 0 and result.stdout.strip():
-                        parts = result.stdout.strip().split('\t')
-                        if len(parts) >= 2:
-                            video_id = parts[0]
-                            title = parts[1] if len(parts) > 1 else "Unknown"
-                            uploader = parts[2] if len(parts) > 2 else source_name
-                            duration_str = parts[3] if len(parts) > 3 else "0"
-                            
-                            try:
-                                duration = int(duration_str) if duration_str and duration_str.isdigit() else 0
-                            except (ValueError, TypeError):
-                                duration = 0
-                            
-                            videos.append({
-                                "id": video_id,
-                                "title": title,
-                                "url": f"https://www.youtube.com/watch?v={video_id}",
-                                "uploader": uploader,
-                                "duration": duration,
-                                "duration_formatted": self.format_duration(duration)
-                            })
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Failed to get video {i} for {source_name}: {e}")
-                    break
-            
-            return videos
-                
-        except Exception as e:
-            self.logger.error(f"❌ Fallback query also failed for {source_name}: {e}")
-        
-        return []
-
-    def check_subtitles_available(self, video_url: str) -> bool:
-        """Check if subtitles are available for a video to avoid 429 errors."""
-        try:
             cmd = [
                 "yt-dlp",
-                "--list-subs",
+                "--flat-playlist",
+                "--playlist-items", f"1-{max_videos}",
+                "--print", "%(id)s\t%(title)s\t%(uploader)s\t%(duration)s",
                 "--no-warnings",
-                "--no-cookies",
-                video_url
+                url
             ]
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=False
-            )
-            
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if 'Language' in line and 'Formats' in line:
-                        if len(lines) > 2:
-                            return True
-                    if line.startswith('en ') or 'english' in line.lower():
-                        return True
-            
-            return False
+            try:
+                for line in self._run_streaming(cmd, self.config.query_timeout * 2):
+                    parts = line.rstrip('\n').split('\t')
+                    if len(parts) >= 2 and parts[0]:
+                        video_id = parts[0]
+                        title = parts[1] if len(parts) > 1 else "Unknown"
+                        uploader = parts[2] if len(parts) > 2 else source_name
+                        duration_str = parts[3] if len(parts) > 3 else "0"
+                        
+                        try:
+                            duration = int(duration_str) if duration_str and duration_str.isdigit() else 0
+                        except (ValueError, TypeError):
+                            duration = 0
+                        
+                        videos.append({
+                            "id": video_id,
+                            "title": title,
+                            "url": f"https://www.youtube.com/watch?v={video_id}",
+                            "uploader": uploader,
+                            "duration": duration,
+                            "duration_formatted": self.format_duration(duration)
+                        })
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+                # Lines printed before the failure are still usable
+                self.logger.warning("⚠️ Fallback query for %s stopped early after %s videos: %s", source_name, len(videos), e)
+                if not videos:
+                    return LISTING_FAILED
             
+            return videos
+                
         except Exception as e:
-            self.logger.warning(f"⚠️ Could not check subtitles availability: {e}")
-            return False
-    
+            self.logger.error("❌ Fallback query also failed for %s: %s", source_name, e)
+        
+        return LISTING_FAILED
+
     def get_playlist_info(self, playlist_url: str) -> Optional[Dict[str, Any]]:
         """Get playlist information including title and total duration."""
         try:
@@ -988,11 +1838,12 @@ class YouTubeFeedDownloader:
             ]
             
             result = subprocess.run(
-                cmd,
+                spawn_command(cmd),
                 capture_output=True,
                 text=True,
                 timeout=self.config.query_timeout,
-                check=False
+                check=False,
+                close_fds=False
             )
             
             if result.returncode == 0 and result.stdout.strip():
@@ -1020,11 +1871,12 @@ class YouTubeFeedDownloader:
                 ]
                 
                 result = subprocess.run(
-                    cmd,
+                    spawn_command(cmd),
                     capture_output=True,
                     text=True,
                     timeout=self.config.query_timeout,
-                    check=False
+                    check=False,
+                    close_fds=False
                 )
                 
                 if result.returncode == 0 and result.stdout.strip():
@@ -1037,61 +1889,40 @@ class YouTubeFeedDownloader:
                     }
                 
         except Exception as e:
-            self.logger.error(f"❌ Error getting playlist info: {e}")
+            self.logger.error("❌ Error getting playlist info: %s", e)
         
         return None
 
+    def _video_format_args(self) -> List[str]:
+        """Format selection and post-processing flags shared by video downloads."""
+        resolution = self.config.max_resolution
+        return [
+            "-f", f"bestvideo[height<={resolution}]+bestaudio/best[height<={resolution}]",
+            "--merge-output-format", "mp4",
+            "--sponsorblock-remove", "sponsor,intro,outro,selfpromo,preview,interaction",
+            "--embed-chapters",
+            "--embed-metadata",
+        ]
+
     def build_download_command(self, video_url: str, source_name: str, skip_subs: bool = False, is_manual: bool = False, resume: bool = False, is_audio: bool = False) -> List[str]:
         """Build the yt-dlp command for video or audio downloads with resume support."""
-        
+        output_dir = self.config.current_audio_dir if is_audio else self.config.current_video_dir
+        # Everything but the URL is the same for every video of a run; build each variant once
+        key = (output_dir, self.config.max_resolution, is_audio, resume, skip_subs or is_audio)
+        base = self._download_args_cache.get(key)
+        if base is None:
+            base = self._build_download_args(output_dir, is_audio, resume, skip_subs)
+            self._download_args_cache[key] = base
+        return [*base, video_url]
+
+    def _build_download_args(self, output_dir: Path, is_audio: bool, resume: bool, skip_subs: bool) -> Tuple[str, ...]:
+        """Build the URL-independent part of a single download command."""
+        output_template = str(output_dir / "%(title)s.%(ext)s")
         if is_audio:
-            output_template = str(self.config.current_audio_dir / "%(title)s.%(ext)s")
-            cmd = [
-                "yt-dlp",
-                "-f", "bestaudio[ext=m4a]/bestaudio/best",
-                "--extract-audio",
-                "--audio-format", "mp3", 
-                "--audio-quality", "320K",
-                "--no-cookies",
-                "--no-cache-dir",
-                "--no-part",
-                "--no-mtime",
-                "--embed-thumbnail",
-                "--embed-metadata",
-                "--no-playlist",
-                "--output", output_template,
-                "--newline",
-                "--no-warnings",
-                "--progress",
-                "--retries", "10",
-                "--fragment-retries", "10",
-                "--file-access-retries", "5", 
-                "--socket-timeout", "30",
-            ]
+            cmd = ["yt-dlp", *YTDLP_AUDIO_FLAGS, *YTDLP_COMMON_FLAGS, "--no-playlist"]
         else:
-            output_template = str(self.config.current_video_dir / "%(title)s.%(ext)s")
-            cmd = [
-                "yt-dlp",
-                "-f", f"bestvideo[height<={self.config.max_resolution}]+bestaudio/best[height<={self.config.max_resolution}]",
-                "--merge-output-format", "mp4",
-                "--no-cookies",
-                "--no-cache-dir",
-                "--no-part",
-                "--no-mtime",
-                "--sponsorblock-remove", "sponsor,intro,outro,selfpromo,preview,interaction",
-                "--embed-chapters",
-                "--embed-metadata",
-                "--no-embed-thumbnail",
-                "--no-playlist",
-                "--output", output_template,
-                "--newline",
-                "--no-warnings",
-                "--progress",
-                "--retries", "10",
-                "--fragment-retries", "10",
-                "--file-access-retries", "5", 
-                "--socket-timeout", "30",
-            ]
+            cmd = ["yt-dlp", *self._video_format_args(), *YTDLP_COMMON_FLAGS, "--no-embed-thumbnail", "--no-playlist"]
+        cmd.extend(["--output", output_template])
         
         # Add resume support if requested
         if resume:
@@ -1102,40 +1933,17 @@ class YouTubeFeedDownloader:
                 "--write-auto-sub",
                 "--write-sub",
                 "--sub-langs", "en",
-                "--convert-subs", "srt",
+                # The embed step converts subtitles to mov_text itself; a separate srt pass is one more ffmpeg run
                 "--embed-subs",
             ])
         
-        cmd.append(video_url)
-        
-        return cmd
+        return tuple(cmd)
 
     def build_audio_download_command(self, video_url: str, source_name: str, is_manual: bool = False, resume: bool = False) -> List[str]:
         """Build the yt-dlp command for MP3 audio downloads with best quality (320kbps) and resume support."""
         output_template = str(self.config.current_audio_dir / "%(title)s.%(ext)s")
         
-        cmd = [
-            "yt-dlp",
-            "-f", "bestaudio[ext=m4a]/bestaudio/best",
-            "--extract-audio",
-            "--audio-format", "mp3",
-            "--audio-quality", "320K",
-            "--no-cookies",
-            "--no-cache-dir", 
-            "--no-part",
-            "--no-mtime",
-            "--embed-metadata",
-            "--embed-thumbnail",
-            "--no-playlist",
-            "--output", output_template,
-            "--newline",
-            "--no-warnings",
-            "--progress",
-            "--retries", "10",
-            "--fragment-retries", "10",
-            "--file-access-retries", "5",
-            "--socket-timeout", "30",
-        ]
+        cmd = ["yt-dlp", *YTDLP_AUDIO_FLAGS, *YTDLP_COMMON_FLAGS, "--no-playlist", "--output", output_template]
         
         # Add resume support if requested
         if resume:
@@ -1145,68 +1953,22 @@ class YouTubeFeedDownloader:
         
         return cmd
     
-    def build_playlist_download_command(self, playlist_url: str, playlist_name: str, download_type: str = "video", resume: bool = False, resume_from: int = 1) -> Tuple[List[str], Path]:
+    def build_playlist_download_command(self, playlist_url: str, playlist_name: str, download_type: str = "video", resume: bool = False) -> Tuple[List[str], Path]:
         """Build the yt-dlp command for downloading entire playlists with video/audio options and resume support."""
-        safe_name = re.sub(r'[<>:"/\\|?*]', '', playlist_name)
+        safe_name = playlist_name.translate(STRIP_UNSAFE_CHARS)
         
         if download_type == "audio":
             playlist_directory = self.config.current_podcast_dir / safe_name
-            output_template = str(playlist_directory / "%(title)s.%(ext)s")
-            
-            cmd = [
-                "yt-dlp",
-                "-f", "bestaudio[ext=m4a]/bestaudio/best",
-                "--extract-audio",
-                "--audio-format", "mp3", 
-                "--audio-quality", "320K",
-                "--no-cookies",
-                "--no-cache-dir",
-                "--no-part",
-                "--no-mtime",
-                "--embed-metadata",
-                "--embed-thumbnail",
-                "--yes-playlist",
-                "--output", output_template,
-                "--newline",
-                "--no-warnings",
-                "--progress",
-                "--retries", "10",
-                "--fragment-retries", "10",
-                "--file-access-retries", "5",
-                "--socket-timeout", "30",
-            ]
+            cmd = ["yt-dlp", *YTDLP_AUDIO_FLAGS, *YTDLP_COMMON_FLAGS]
         else:
             playlist_directory = self.config.current_playlist_dir / safe_name
-            output_template = str(playlist_directory / "%(title)s.%(ext)s")
-            
-            cmd = [
-                "yt-dlp",
-                "-f", f"bestvideo[height<={self.config.max_resolution}]+bestaudio/best[height<={self.config.max_resolution}]",
-                "--merge-output-format", "mp4",
-                "--no-cookies",
-                "--no-cache-dir",
-                "--no-part",
-                "--no-mtime",
-                "--sponsorblock-remove", "sponsor,intro,outro,selfpromo,preview,interaction",
-                "--embed-metadata",
-                "--embed-chapters",
-                "--yes-playlist",
-                "--output", output_template,
-                "--newline",
-                "--no-warnings",
-                "--progress",
-                "--retries", "10",
-                "--fragment-retries", "10",
-                "--file-access-retries", "5",
-                "--socket-timeout", "30",
-            ]
+            cmd = ["yt-dlp", *self._video_format_args(), *YTDLP_COMMON_FLAGS]
+        output_template = str(playlist_directory / "%(title)s.%(ext)s")
+        cmd.extend(["--yes-playlist", "--output", output_template])
         
         # Add resume support if requested
         if resume:
             cmd.append("--continue")
-            # Start from specific playlist item if resuming
-            if resume_from > 1:
-                cmd.extend(["--playlist-start", str(resume_from)])
         
         cmd.append(playlist_url)
         
@@ -1215,44 +1977,38 @@ class YouTubeFeedDownloader:
     
     def parse_progress(self, line: str) -> Optional[Dict[str, str]]:
         """Parse yt-dlp progress output."""
-        # Current video progress
-        progress_match = re.search(
-            r'\[download\]\s+(\d+\.?\d*)%\s+of\s+~?\s*(\d+\.?\d*)(\w+)\s+at\s+(\d+\.?\d*)(\w+)/s\s+ETA\s+(\d+:\d+|\d+)',
-            line
-        )
+        # Most lines start with another tag; one prefix check skips the regex for them
+        if not line.startswith(PROGRESS_LINE_PREFIXES):
+            return None
+        
+        match = PROGRESS_REGEX.match(line)
+        if match is None:
+            return None
         
-        if progress_match:
+        kind = match.lastgroup
+        if kind == "download":
+            # Current video progress
             return {
                 "type": "download",
-                "percent": progress_match.group(1),
-                "size": f"{progress_match.group(2)}{progress_match.group(3)}",
-                "speed": f"{progress_match.group(4)}{progress_match.group(5)}/s",
-                "eta": progress_match.group(6)
+                "percent": match.group("percent"),
+                "size": f"{match.group('size')}{match.group('size_unit')}",
+                "speed": f"{match.group('speed')}{match.group('speed_unit')}/s",
+                "eta": match.group("eta")
             }
-        
-        # Extract audio/conversion progress
-        extract_match = re.search(r'\[ExtractAudio\]\s+Destination:\s+(.+)', line)
-        if extract_match:
-            return {"type": "extract", "file": extract_match.group(1)}
-        
-        # FFmpeg conversion progress
-        ffmpeg_match = re.search(r'\[FFmpeg\]\s+Converting\s+.+\s+to\s+.+', line)
-        if ffmpeg_match:
+        if kind == "extract":
+            # Extract audio/conversion progress
+            return {"type": "extract", "file": match.group("file")}
+        if kind == "converting":
+            # FFmpeg conversion progress
             return {"type": "converting"}
-        
-        # New video starting in playlist
-        playlist_match = re.search(r'\[download\]\s+Downloading\s+item\s+(\d+)\s+of\s+(\d+)', line)
-        if playlist_match:
+        if kind == "playlist_progress":
+            # New video starting in playlist
             return {
                 "type": "playlist_progress",
-                "current": playlist_match.group(1),
-                "total": playlist_match.group(2)
+                "current": match.group("current"),
+                "total": match.group("total")
             }
-        
-        if "[download] Destination:" in line:
-            return {"type": "starting"}
-            
-        return None
+        return {"type": "starting"}
     
     def display_double_progress_bar(self, current_percent: float, overall_percent: float, current_info: str = "", 
                                   current_size: str = "", current_speed: str = "", current_eta: str = "", 
@@ -1260,11 +2016,11 @@ class YouTubeFeedDownloader:
         """Display dual progress bars for playlist downloads."""
         # Current video progress bar
         current_filled = int(width * current_percent / 100)
-        current_bar = f"[green]{'█' * current_filled}[/green][dim]{'░' * (width - current_filled)}[/dim]"
+        current_bar = f"[green]{self._BAR_FULL[:current_filled]}[/green][dim]{self._BAR_EMPTY[:width - current_filled]}[/dim]"
         
         # Overall playlist progress bar  
         overall_filled = int(width * overall_percent / 100)
-        overall_bar = f"[blue]{'█' * overall_filled}[/blue][dim]{'░' * (width - overall_filled)}[/dim]"
+        overall_bar = f"[blue]{self._BAR_FULL[:overall_filled]}[/blue][dim]{self._BAR_EMPTY[:width - overall_filled]}[/dim]"
         
         # Print with cursor control
         # \033[K clears the line.
@@ -1289,84 +2045,86 @@ class YouTubeFeedDownloader:
         """Clean up temporary subtitle files after embedding."""
         try:
             # More aggressive cleanup for problematic titles
-            clean_title = re.sub(r'[<>:"/\\|?*]', '_', video_title)
-            clean_title = re.sub(r'\s+', ' ', clean_title).strip()
-            
-            # Look for subtitle files with different patterns
-            subtitle_patterns = [
-                f"*{clean_title}*.en.srt",
-                f"*{clean_title}*.srt", 
-                f"*{clean_title}*.vtt",
-                f"*{clean_title}*.en.vtt",
-                f"*.srt", # Fallback to catch all srt/vtt if specific match fails, carefully
-                f"*.vtt"
-            ]
+            clean_title = video_title.translate(REPLACE_UNSAFE_CHARS)
+            clean_title = WHITESPACE_REGEX.sub(' ', clean_title).strip()
+            
+            # One directory pass over subtitle files named after this video only; other files
+            # may belong to parallel downloads that have not embedded theirs yet
+            title_key = clean_title.lower()
+            matched = []
+            with os.scandir(self.config.current_video_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if not name.endswith(('.srt', '.vtt')):
+                        continue
+                    try:
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        if title_key in name.lower():
+                            matched.append(entry)
+                    except OSError:
+                        continue
             
             files_cleaned = 0
-            for pattern in subtitle_patterns:
-                full_pattern = os.path.join(self.config.current_video_dir, pattern)
-                for file_path in glob.glob(full_pattern):
-                    try:
-                        if file_path.endswith(('.srt', '.vtt')) and os.path.isfile(file_path):
-                            # Ensure we don't delete the video file itself by checks
-                            if not file_path.endswith(('.mp4', '.mkv', '.webm', '.mp3', '.m4a')):
-                                try:
-                                    os.remove(file_path)
-                                    self.logger.info(f"🧹 Cleaned up subtitle file: {os.path.basename(file_path)}")
-                                    files_cleaned += 1
-                                except FileNotFoundError:
-                                    pass
-                    except OSError as e:
-                        self.logger.warning(f"⚠️ Could not remove subtitle file {file_path}: {e}")
-            
-            # Additional cleanup: remove any .srt or .vtt files in the directory that were created recently
-            if files_cleaned == 0:
-                current_time = time.time()
-                for ext in ['.srt', '.vtt']:
-                    for file_path in self.config.current_video_dir.glob(f"*{ext}"):
-                        try:
-                            # Remove files created in the last hour
-                            if file_path.stat().st_mtime > current_time - 3600:
-                                os.remove(file_path)
-                                self.logger.info(f"🧹 Cleaned up recent subtitle file: {file_path.name}")
-                                files_cleaned += 1
-                        except OSError as e:
-                            self.logger.warning(f"⚠️ Could not remove recent subtitle file {file_path}: {e}")
-            
-            self.logger.info(f"🧹 Subtitle cleanup completed: {files_cleaned} files removed")
+            for entry in matched:
+                try:
+                    os.remove(entry.path)
+                    self.logger.info("🧹 Cleaned up subtitle file: %s", entry.name)
+                    files_cleaned += 1
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    self.logger.warning("⚠️ Could not remove subtitle file %s: %s", entry.path, e)
+            
+            self.logger.info("🧹 Subtitle cleanup completed: %s files removed", files_cleaned)
                         
         except Exception as e:
-            self.logger.error(f"❌ Error during subtitle cleanup: {e}")
+            self.logger.error("❌ Error during subtitle cleanup: %s", e)
     
     def check_existing_download(self, video_info: Dict[str, Any], download_type: str = "video") -> Tuple[bool, int]:
         """Check if download exists and can be resumed. Returns (can_resume, progress_percent)."""
         try:
             video_title = video_info.get("title", "Unknown")
-            clean_title = re.sub(r'[<>:"/\\|?*]', '_', video_title)
+            clean_title = video_title.translate(REPLACE_UNSAFE_CHARS)
             
             if download_type == "video":
                 download_dir = self.config.current_video_dir
-                file_pattern = f"*{clean_title}*.mp4"
+                extension = ".mp4"
             else:  # audio
                 download_dir = self.config.current_audio_dir
-                file_pattern = f"*{clean_title}*.mp3"
+                extension = ".mp3"
             
-            # Look for existing files
-            for file_path in download_dir.glob(file_pattern):
-                if file_path.is_file():
-                    file_size = file_path.stat().st_size
-                    
-                    # If file is larger than 1MB, assume it's partially downloaded
-                    if file_size > 1024 * 1024:
-                        return True, 50
-                    
-                    # If file exists and is complete, return 100%
-                    return True, 100
+            # The output template is "%(title)s.%(ext)s", so try the exact name with a single stat first
+            file_size = None
+            try:
+                expected = os.stat(download_dir / f"{clean_title}{extension}")
+                if stat_module.S_ISREG(expected.st_mode):
+                    file_size = expected.st_size
+            except OSError:
+                pass
             
-            return False, 0
+            # yt-dlp sanitises some characters differently, so fall back to a listing.
+            # A plain substring test also keeps "[" in titles from acting as a glob
+            if file_size is None:
+                with os.scandir(download_dir) as it:
+                    for entry in it:
+                        # is_file() answers from d_type; the lstat is shared with the size check
+                        if entry.name.endswith(extension) and clean_title in entry.name and entry.is_file(follow_symlinks=False):
+                            file_size = entry.stat(follow_symlinks=False).st_size
+                            break
+            
+            if file_size is None:
+                return False, 0
+            
+            # If file is larger than 1MB, assume it's partially downloaded
+            if file_size > 1024 * 1024:
+                return True, 50
+            
+            # If file exists and is complete, return 100%
+            return True, 100
             
         except Exception as e:
-            self.logger.warning(f"⚠️ Error checking existing download: {e}")
+            self.logger.warning("⚠️ Error checking existing download: %s", e)
             return False, 0
 
     def download_video(self, video_info: Dict[str, Any], source_name: str, is_manual: bool = False, progress: Optional[Progress] = None, task_id: Any = None, is_audio: bool = False) -> Tuple[bool, str]:
@@ -1406,11 +2164,6 @@ class YouTubeFeedDownloader:
                 grid.add_row("Status:", resume_msg)
                 
             console.print(Panel(grid, title=f"[bold green]Downloading {download_type.capitalize()}[/]", border_style="green"))
-            
-            if not is_audio:
-                print("   🔍 Checking for subtitles...", end="", flush=True)
-            
-        has_subtitles = self.check_subtitles_available(video_url) if not is_audio else False
         
         # Update resume state
         if resume:
@@ -1422,25 +2175,19 @@ class YouTubeFeedDownloader:
                 "type": download_type
             })
         
-        if has_subtitles and not is_audio:
+        # Videos always ask for subtitles first: yt-dlp only warns when there are none, and a
+        # subtitle failure is retried without them, so no separate availability probe is needed
+        cmd = self.build_download_command(video_url, source_name, skip_subs=is_audio, is_manual=is_manual, resume=resume, is_audio=is_audio)
+        success, video_id, error_msg = self._execute_download(cmd, video_info, source_name, is_audio=is_audio, progress=progress, task_id=task_id)
+        
+        if not success and not is_audio and ("subtitles" in error_msg.lower() or "429" in error_msg):
             if not progress:
-                print(" ✅ (Subtitles available)")
-            cmd = self.build_download_command(video_url, source_name, skip_subs=False, is_manual=is_manual, resume=resume, is_audio=is_audio)
-            success, video_id, error_msg = self._execute_download(cmd, video_info, source_name, is_audio=is_audio, progress=progress, task_id=task_id)
-            
-            if not success and ("subtitles" in error_msg.lower() or "429" in error_msg):
-                if not progress:
-                    print(f"   ⚠️ Subtitle error detected, retrying without subtitles...")
-                cmd = self.build_download_command(video_url, source_name, skip_subs=True, is_manual=is_manual, resume=resume, is_audio=is_audio)
-                success, video_id, _ = self._execute_download(cmd, video_info, source_name, is_audio=is_audio, progress=progress, task_id=task_id)
-        else:
-            if not progress and not is_audio:
-                print(" ⚠️ (No subtitles available)")
+                print(f"   ⚠️ Subtitle error detected, retrying without subtitles...")
             cmd = self.build_download_command(video_url, source_name, skip_subs=True, is_manual=is_manual, resume=resume, is_audio=is_audio)
-            success, video_id, error_msg = self._execute_download(cmd, video_info, source_name, is_audio=is_audio, progress=progress, task_id=task_id)
+            success, video_id, _ = self._execute_download(cmd, video_info, source_name, is_audio=is_audio, progress=progress, task_id=task_id)
         
         if success:
-            if has_subtitles and not is_audio:
+            if not is_audio:
                 self.cleanup_subtitle_files(video_title, is_manual=is_manual)
             
             if not progress:
@@ -1467,91 +2214,134 @@ class YouTubeFeedDownloader:
         
         try:
             download_type = "audio" if is_audio else "video"
-            self.logger.info(f"🚀 Starting {download_type} download: {source_name} - {video_title}")
+            self.logger.info("🚀 Starting %s download: %s - %s", download_type, source_name, video_title)
             
+            # One merged stream read line by line: no select() wake-ups, and nothing is
+            # left unread in the pipes when the process exits
             process = subprocess.Popen(
-                cmd,
+                spawn_command(cmd),
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                stderr=subprocess.STDOUT,
+                bufsize=PIPE_BUFFER_SIZE,
+                close_fds=False
             )
+            enlarge_pipe(process.stdout)
             
             state = {
                 "last_percent": 0,
-                "initial_progress_printed": False
+                "initial_progress_printed": False,
+                # Throughput accounting: yt-dlp restarts at 0% for each format it fetches
+                "segment_start": None,
+                "segment_percent": 0.0,
+                "segment_size": 0.0,
+                "bytes": 0.0,
+                # Rich re-renders on every update; only send visible changes
+                "last_update_time": 0.0,
+                "last_percent_sent": -1.0
             }
             
-            stderr_lines = []
-            
-            while True:
-                if process.poll() is not None:
-                    break
-                    
-                ready, _, _ = select.select([process.stdout, process.stderr], [], [], 0.1)
+            # Only the tail of the diagnostics is reported, so keep a bounded window
+            stderr_lines = deque(maxlen=64)
+            saw_error = False
+            
+            # Lines stay bytes; only progress lines are decoded, diagnostics once at the end
+            for raw_line in process.stdout:
+                # yt-dlp's own output is "[extractor] ..." tagged; anything else is a diagnostic
+                if not raw_line.startswith(b'['):
+                    stderr_lines.append(raw_line)
+                    if b"ERROR:" in raw_line:
+                        saw_error = True
+                    continue
+                if not raw_line.startswith(PROGRESS_LINE_TAGS):
+                    continue
                 
-                for stream in ready:
-                    line = stream.readline()
-                    if not line:
-                        continue
-                    
-                    if stream == process.stderr:
-                        stderr_lines.append(line)
+                progress_dict = self.parse_progress(raw_line.decode('utf-8', 'replace'))
+                
+                if progress_dict:
+                    if progress_dict.get("type") == "download" and "percent" in progress_dict:
+                        self._track_transfer(state, float(progress_dict["percent"]), progress_dict.get("size", ""))
                     
-                    progress_dict = self.parse_progress(line)
+                    if progress and task_id is not None:
+                        # Update Rich Progress Bar
+                        if progress_dict.get("type") == "starting":
+                            progress.update(task_id, description=f"[yellow]Connecting...[/yellow] {video_title}", visible=True)
+                        elif progress_dict.get("type") == "download" and "percent" in progress_dict:
+                            percent = float(progress_dict["percent"])
+                            now = time.monotonic()
+                            if (percent < 100 and now - state["last_update_time"] < self.PROGRESS_UPDATE_INTERVAL
+                                    and abs(percent - state["last_percent_sent"]) < self.PROGRESS_UPDATE_STEP):
+                                continue
+                            state["last_update_time"] = now
+                            state["last_percent_sent"] = percent
+                            speed = progress_dict.get("speed", "")
+                            eta = progress_dict.get("eta", "")
+                            progress.update(task_id, completed=percent, description=f"{video_title}", speed=f"{speed}", eta=f"{eta}", visible=True)
                     
-                    if progress_dict:
-                        if progress and task_id is not None:
-                            # Update Rich Progress Bar
-                            if progress_dict.get("type") == "starting":
-                                progress.update(task_id, description=f"[yellow]Connecting...[/yellow] {video_title}", visible=True)
-                            elif progress_dict.get("type") == "download" and "percent" in progress_dict:
-                                percent = float(progress_dict["percent"])
-                                speed = progress_dict.get("speed", "")
-                                eta = progress_dict.get("eta", "")
-                                progress.update(task_id, completed=percent, description=f"{video_title}", speed=f"{speed}", eta=f"{eta}", visible=True)
-                        
-                        else:
-                            # Legacy Print Output
-                            if progress_dict.get("type") == "starting" and not state["initial_progress_printed"]:
-                                print("   📡 Connecting...", end="", flush=True)
-                                state["initial_progress_printed"] = True
-                            elif progress_dict.get("type") == "download" and "percent" in progress_dict:
-                                percent = float(progress_dict["percent"])
-                                if percent > state["last_percent"]:
-                                    self.display_single_progress_bar(
-                                        percent,
-                                        progress_dict.get("size", ""),
-                                        progress_dict.get("speed", ""),
-                                        progress_dict.get("eta", "")
-                                    )
-                                    state["last_percent"] = percent
-                                    if percent >= 100:
-                                        print()
+                    else:
+                        # Legacy Print Output
+                        if progress_dict.get("type") == "starting" and not state["initial_progress_printed"]:
+                            self._emit("   📡 Connecting...")
+                            state["initial_progress_printed"] = True
+                        elif progress_dict.get("type") == "download" and "percent" in progress_dict:
+                            percent = float(progress_dict["percent"])
+                            if percent > state["last_percent"]:
+                                self.display_single_progress_bar(
+                                    percent,
+                                    progress_dict.get("size", ""),
+                                    progress_dict.get("speed", ""),
+                                    progress_dict.get("eta", "")
+                                )
+                                state["last_percent"] = percent
+                                if percent >= 100 and self._stdout_is_tty:
+                                    self._emit("\n")
             
             return_code = process.wait()
-            error_summary = "".join(stderr_lines[-5:]) if stderr_lines else "Unknown error"
+            error_summary = b"".join(list(stderr_lines)[-5:]).decode('utf-8', 'replace') if stderr_lines else "Unknown error"
+            
+            self._track_transfer(state, 0.0, "")
+            self.concurrency.add_bytes(state["bytes"])
+            if return_code != 0 or saw_error:
+                # Timeouts and YouTube rate limiting both mean the pool should shrink next batch
+                lowered = error_summary.lower()
+                if "timed out" in lowered or "429" in lowered or "too many requests" in lowered:
+                    self.concurrency.record_stall()
             
             if return_code == 0:
                 # Double check stderr for "ERROR:" because sometimes yt-dlp returns 0 even on failure
-                if any("ERROR:" in line for line in stderr_lines):
+                if saw_error:
                     return False, video_id, error_summary
                 return True, video_id, ""
             else:
                 return False, video_id, error_summary
                 
         except subprocess.TimeoutExpired:
-            self.logger.error(f"⏱️ Download timeout for {source_name}")
+            self.logger.error("⏱️ Download timeout for %s", source_name)
+            self.concurrency.record_stall()
             return False, video_id, "Download timeout"
         except Exception as e:
-            self.logger.error(f"❌ Download error for {source_name}: {e}")
+            self.logger.error("❌ Download error for %s: %s", source_name, e)
             return False, video_id, str(e)
 
+    @staticmethod
+    def _track_transfer(state: Dict[str, Any], percent: float, size: str) -> None:
+        """Accumulate bytes transferred from successive progress lines into state["bytes"]."""
+        if state["segment_start"] is not None and percent < state["segment_percent"]:
+            # Progress went backwards: the previous file finished, count what it moved
+            moved = state["segment_percent"] - state["segment_start"]
+            state["bytes"] += state["segment_size"] * moved / 100
+            state["segment_start"] = None
+        if size:
+            if state["segment_start"] is None:
+                state["segment_start"] = percent
+            state["segment_percent"] = percent
+            state["segment_size"] = parse_size(size)
+
     def display_single_progress_bar(self, percent: float, size: str = "", speed: str = "", eta: str = "", width: int = 40):
         """Display single download progress bar."""
+        if not self._stdout_is_tty:
+            return
         filled = int(width * percent / 100)
-        bar = "█" * filled + "░" * (width - filled)
+        bar = self._BAR_FULL[:filled] + self._BAR_EMPTY[:width - filled]
         
         info_parts = [f"{percent:.1f}%"]
         if size:
@@ -1562,7 +2352,13 @@ class YouTubeFeedDownloader:
             info_parts.append(f"ETA:{eta}")
         
         info = " ".join(info_parts)
-        print(f"\r\033[K   [{bar}] {info}", end="", flush=True)
+        self._emit(f"{self._BAR_PREFIX}{bar}] {info}")
+    
+    def _emit(self, text: str) -> None:
+        """Write and flush a chunk of terminal output in one piece."""
+        with self._stdout_lock:
+            sys.stdout.write(text)
+            sys.stdout.flush()
     
     def _save_download_success(self, video_info: Dict[str, Any], source_name: str, video_title: str, is_audio: bool = False) -> None:
         """Save download success information."""
@@ -1574,28 +2370,142 @@ class YouTubeFeedDownloader:
             "url": video_info["url"],
             "duration": video_info.get("duration_formatted", "Unknown"),
             "type": download_type,
-            "private": True,
-            "timestamp": datetime.now().isoformat()
+            "private": True
         })
     
-    def process_channel_auto(self, handle: str, display_name: str) -> List[Tuple[Dict[str, Any], str, str]]:
-        """Process a YouTube channel and return new videos since last check WITH LIMITS."""
-        download_tasks = []
-        
-        # Determine maximum videos to check
-        # Determine maximum videos to check
+    def channel_check_limit(self) -> int:
+        """Number of recent videos to check on a known channel."""
         # If it's a known channel, we want to check enough videos to bridge the gap since last run.
         # Default to a safe number (e.g., 10) to catch up on missed daily videos.
         check_limit = self.config.gap_check_limit
         if hasattr(self.config, 'max_videos_per_channel') and self.config.max_videos_per_channel > check_limit:
             # If user configured a higher manual limit, respect it
             check_limit = self.config.max_videos_per_channel
+        return check_limit
+
+    def channels_due_for_check(self) -> Dict[str, str]:
+        """Return the channels not checked within min_recheck_seconds, in config order."""
+        min_age = self.config.min_recheck_seconds
+        if min_age <= 0:
+            return self.channels
+        now = time.time()
+        channels = self._channels_index
+        return {
+            handle: name for handle, name in self.channels.items()
+            if now - channels.get(handle, {}).get("last_check_ts", 0) >= min_age
+        }
+
+    def mark_channels_checked(self, handles: List[str]) -> None:
+        """Record when channels were last checked so rechecks can be throttled.
+
+        Only pass channels whose listing succeeded; failed ones must stay due.
+        """
+        if self.config.min_recheck_seconds <= 0:
+            return
+        now = time.time()
+        for handle in handles:
+            # Channels without history stay due so they still get the new-channel prompt
+            entry = self._channels_index.get(handle)
+            if entry is not None:
+                entry["last_check_ts"] = now
+                self._history_dirty = True
+
+    def needs_limit_prompt(self, handle: str) -> bool:
+        """Whether checking this channel asks the user for a video limit first."""
+        return handle not in self._channels_index or self.config.ask_video_limit_per_channel
+
+    def ask_channel_limits(self, channels: List[Tuple[str, str]]) -> Dict[str, int]:
+        """Ask once for the video limits of all (handle, name) channels that need one."""
+        check_limit = self.channel_check_limit()
+        limits = {
+            handle: self.config.initial_videos_per_channel if handle not in self._channels_index else check_limit
+            for handle, _ in channels
+        }
+        if not channels or not sys.stdin.isatty():
+            return limits
+        
+        console.print("")
+        console.print("[bold cyan]🔍 Video limits needed for these channels:[/bold cyan]")
+        for number, (handle, name) in enumerate(channels, 1):
+            marker = "🆕 " if handle not in self._channels_index else ""
+            console.print(f"   {number}. {marker}{name} [dim](default {limits[handle]})[/dim]")
+        
+        try:
+            answer = console.input(
+                "   How many recent videos to check? One number for all, or a comma list in order "
+                "[dim](blank keeps the default)[/dim]: "
+            ).strip()
+        except EOFError:
+            return limits
+        if not answer:
+            return limits
+        
+        parts = [part.strip() for part in answer.split(",")]
+        if len(parts) == 1:
+            parts = parts * len(channels)
+        for (handle, name), part in zip(channels, parts):
+            if not part or part.lower() == "default":
+                continue
+            try:
+                limits[handle] = int(part)
+            except ValueError:
+                console.print(f"   [red]Invalid number for {name}, using default {limits[handle]}[/red]")
+        return limits
+
+    def fetch_recent_videos_parallel(self, sources: List[Tuple[str, str, int]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch recent videos for (url, name, max_videos) sources concurrently, keyed by URL."""
+        results = {}
+        if not sources:
+            return results
+        
+        # Listing is pure yt-dlp I/O and touches no shared history, so the queries can overlap;
+        # one spinner for all of them since concurrent spinners garble the terminal
+        workers = min(self.MAX_PARALLEL_LISTINGS, len(sources))
+        with console.status(f"[bold blue]🔍 Checking {len(sources)} sources...[/bold blue]"):
+            # Managed by hand: leaving a with block on Ctrl-C would still run every queued query
+            executor = ThreadPoolExecutor(max_workers=workers)
+            future_to_url = {}
+            try:
+                for url, name, max_videos in sources:
+                    future = executor.submit(self.get_all_recent_videos, url, name, max_videos=max_videos, silent=True)
+                    future_to_url[future] = url
+                for future in as_completed(future_to_url):
+                    url = future_to_url[future]
+                    try:
+                        results[url] = future.result()
+                    except Exception as e:
+                        self.logger.error("❌ Query error for %s: %s", url, e)
+                        results[url] = LISTING_FAILED
+            except BaseException:
+                # Drop the queued queries and kill the running ones instead of waiting them out
+                # (same as shutdown(cancel_futures=True), which needs Python 3.9)
+                for future in future_to_url:
+                    future.cancel()
+                self.kill_child_processes()
+                executor.shutdown(wait=False)
+                raise
+            executor.shutdown()
+        return results
+
+    def process_channel_auto(self, handle: str, display_name: str, recent_videos: Optional[List[Dict[str, Any]]] = None,
+                             limit: Optional[int] = None) -> List[DownloadTask]:
+        """Process a YouTube channel and return new videos since last check WITH LIMITS.
+
+        recent_videos can carry an already fetched listing, and limit an answer from
+        ask_channel_limits so the channel is checked without prompting.
+        """
+        download_tasks = []
+        
+        # Determine maximum videos to check
+        check_limit = self.channel_check_limit()
         
         # Check if channel is new (never downloaded from before)
-        is_new_channel = handle not in self.channel_history.get("channels", {})
+        is_new_channel = handle not in self._channels_index
         
+        if limit is not None:
+            check_limit = limit
         # Prompt if new channel OR global setting enabled
-        if is_new_channel or self.config.ask_video_limit_per_channel:
+        elif is_new_channel or self.config.ask_video_limit_per_channel:
             # Clear previous spinner/output if any
             console.print("")
             if is_new_channel:
@@ -1628,13 +2538,14 @@ class YouTubeFeedDownloader:
 
         # Get recent videos with the configured limit
         # Use a spinner for visual feedback
-        with console.status(f"[bold blue]🔍 Checking {display_name}...[/bold blue]"):
-            recent_videos = self.get_all_recent_videos(
-                f"https://www.youtube.com/@{handle}/videos",
-                display_name,
-                max_videos=fetch_limit,
-                silent=True
-            )
+        if recent_videos is None:
+            with console.status(f"[bold blue]🔍 Checking {display_name}...[/bold blue]"):
+                recent_videos = self.get_all_recent_videos(
+                    f"https://www.youtube.com/@{handle}/videos",
+                    display_name,
+                    max_videos=fetch_limit,
+                    silent=True
+                )
         
         if not recent_videos:
             console.print(f"[dim]🔍 {display_name}: No new videos[/dim]")
@@ -1644,14 +2555,16 @@ class YouTubeFeedDownloader:
             videos_to_process = recent_videos[:check_limit]
             videos_to_mark = recent_videos[check_limit:]
             
+            now_iso = datetime.now().isoformat()
             for v in videos_to_mark:
-                self.update_channel_history(handle, v)
+                self.update_channel_history(handle, v, now_iso)
                 
             recent_videos = videos_to_process
             
         new_videos_count = 0
         already_downloaded_count = 0
         shorts_skipped = 0
+        new_video_infos = []
         
         # Sort recent videos by date (oldest first) to ensure we download in chronological order
         # This helps with the "download all remaining video from last download" request
@@ -1671,6 +2584,8 @@ class YouTubeFeedDownloader:
                  # IF 'max_videos' is large enough.
                  pass
 
+        # One history lookup for the whole channel instead of one per video
+        downloaded_ids = self.get_downloaded_ids(handle)
         for video_info in recent_videos:
             video_id = video_info["id"]
             
@@ -1680,12 +2595,13 @@ class YouTubeFeedDownloader:
                 continue
             
             # Check if video has already been downloaded using our comprehensive history
-            if self.is_video_downloaded(handle, video_id):
+            if video_id in downloaded_ids:
                 already_downloaded_count += 1
                 continue
             
             # This is a new video to download
-            download_tasks.append((video_info, display_name, "channel"))
+            download_tasks.append(DownloadTask(video_info, display_name, "channel", handle))
+            new_video_infos.append(video_info)
             new_videos_count += 1
         
         # Display results using Tree
@@ -1698,18 +2614,8 @@ class YouTubeFeedDownloader:
             
             # Show first 3 new videos
             videos_node = tree.add(f"📥 [bold]{new_videos_count}[/bold] to download")
-            new_videos_shown = 0
-            for video_info in recent_videos:
-                if new_videos_shown >= 3:
-                    break
-                video_id = video_info["id"]
-                # Skip shorts in display too
-                if self.config.filter_shorts and video_info.get("duration", 0) < 60:
-                    continue
-                    
-                if not self.is_video_downloaded(handle, video_id):
-                    videos_node.add(f"[cyan]{video_info.get('title', 'Unknown')}[/cyan]")
-                    new_videos_shown += 1
+            for video_info in new_video_infos[:3]:
+                videos_node.add(f"[cyan]{video_info.get('title', 'Unknown')}[/cyan]")
             
             if new_videos_count > 3:
                 videos_node.add(f"[dim]... and {new_videos_count - 3} more[/dim]")
@@ -1725,7 +2631,7 @@ class YouTubeFeedDownloader:
         
         return download_tasks
 
-    def process_playlist_auto(self, playlist_url: str, playlist_name: str) -> List[Tuple[Dict[str, Any], str, str]]:
+    def process_playlist_auto(self, playlist_url: str, playlist_name: str, recent_videos: Optional[List[Dict[str, Any]]] = None) -> List[DownloadTask]:
         """Process a YouTube playlist and return new videos since last check WITH LIMITS."""
         download_tasks = []
         
@@ -1733,8 +2639,9 @@ class YouTubeFeedDownloader:
         max_videos = self.config.max_videos_per_channel
         
         # Get recent videos from playlist - use silent mode
-        with console.status(f"[bold blue]🔍 Checking {playlist_name}...[/bold blue]"):
-            recent_videos = self.get_all_recent_videos(playlist_url, playlist_name, max_videos=max_videos, silent=True)
+        if recent_videos is None:
+            with console.status(f"[bold blue]🔍 Checking {playlist_name}...[/bold blue]"):
+                recent_videos = self.get_all_recent_videos(playlist_url, playlist_name, max_videos=max_videos, silent=True)
         
         if not recent_videos:
             console.print(f"[dim]🔍 {playlist_name}: No videos found or error[/dim]")
@@ -1744,6 +2651,8 @@ class YouTubeFeedDownloader:
         already_downloaded_count = 0
         shorts_skipped = 0
         
+        # Use playlist URL as identifier for history tracking
+        downloaded_ids = self.get_downloaded_ids(playlist_url)
         for video_info in recent_videos:
             video_id = video_info["id"]
             
@@ -1752,16 +2661,13 @@ class YouTubeFeedDownloader:
                 shorts_skipped += 1
                 continue
             
-            # Use playlist URL as identifier for history tracking
-            playlist_id = playlist_url
-            
             # Check if video has already been downloaded
-            if self.is_video_downloaded(playlist_id, video_id):
+            if video_id in downloaded_ids:
                 already_downloaded_count += 1
                 continue
             
             # This is a new video to download
-            download_tasks.append((video_info, playlist_name, "playlist"))
+            download_tasks.append(DownloadTask(video_info, playlist_name, "playlist", playlist_url))
             new_videos_count += 1
         
         # Display results using Tree
@@ -1815,8 +2721,9 @@ class YouTubeFeedDownloader:
             except ValueError:
                 console.print("   [bold red]❌ Please enter a valid number[/bold red]")
 
-    def process_channel_first_run(self, handle: str, display_name: str, video_limit: int, item_type: str = "channel") -> List[Tuple[Dict[str, Any], str, str]]:
-        """Process a channel on first run with limited recent videos."""
+    def process_channel_first_run(self, handle: str, display_name: str, video_limit: int, item_type: str = "channel",
+                                  recent_videos: Optional[List[Dict[str, Any]]] = None) -> List[DownloadTask]:
+        """Process a channel on first run with limited recent videos, optionally from a prefetched listing."""
         download_tasks = []
         
         # If video_limit is 0, skip downloading entirely
@@ -1828,13 +2735,14 @@ class YouTubeFeedDownloader:
         target_url = f"https://www.youtube.com/@{handle}/videos" if item_type == "channel" else handle
         
         # Use silent mode to avoid duplicate printing
-        with console.status(f"[bold blue]🔍 Scanning {display_name}...[/bold blue]"):
-            recent_videos = self.get_all_recent_videos(
-                target_url,
-                display_name,
-                max_videos=fetch_limit,
-                silent=True  # Don't print from the method itself
-            )
+        if recent_videos is None:
+            with console.status(f"[bold blue]🔍 Scanning {display_name}...[/bold blue]"):
+                recent_videos = self.get_all_recent_videos(
+                    target_url,
+                    display_name,
+                    max_videos=fetch_limit,
+                    silent=True  # Don't print from the method itself
+                )
         
         if not recent_videos:
             console.print(f"[dim]🔍 {display_name}: No videos found or error[/dim]")
@@ -1843,13 +2751,14 @@ class YouTubeFeedDownloader:
         if len(recent_videos) > video_limit:
             videos_to_process = recent_videos[:video_limit]
             videos_to_mark = recent_videos[video_limit:]
+            now_iso = datetime.now().isoformat()
             for v in videos_to_mark:
-                self.update_channel_history(handle, v)
+                self.update_channel_history(handle, v, now_iso)
             recent_videos = videos_to_process
         
         # On first run, download all the recent videos we found (up to limit)
         for video_info in recent_videos:
-            download_tasks.append((video_info, display_name, item_type))
+            download_tasks.append(DownloadTask(video_info, display_name, item_type, handle))
         
         # Display results using Tree
         tree = Tree(f"[bold blue]🔍 {display_name}[/bold blue]")
@@ -1874,7 +2783,7 @@ class YouTubeFeedDownloader:
         
         return download_tasks
 
-    def download_videos_parallel(self, download_tasks: List[Tuple[Dict[str, Any], str, str]]) -> int:
+    def download_videos_parallel(self, download_tasks: List[DownloadTask]) -> int:
         """Download multiple videos in parallel and update channel history."""
         successful_downloads = 0
         
@@ -1902,62 +2811,126 @@ class YouTubeFeedDownloader:
             # we will stick to the multi-bar approach which IS the standard "improvised" way to handle parallel downloads in CLI.
             # Alternating bars in one line is bad, so we use Rich properly which stacks them.
             
-            with progress:
-                with ThreadPoolExecutor(max_workers=self.config.max_parallel_downloads) as executor:
+            worker_count = self.parallel_download_count()
+            self._stop_downloads.clear()
+            self.concurrency.reseed(worker_count)
+            self.concurrency.start_batch()
+            unsaved_downloads = 0
+            last_history_save = time.monotonic()
+            try:
+                with progress:
+                    # Managed by hand: leaving a with block on Ctrl-C would start every queued download
+                    executor = ThreadPoolExecutor(max_workers=worker_count)
                     future_to_task = {}
-                    
-                    for video_info, source_name, task_type in download_tasks:
-                        # Add task to progress bar
-                        video_title = video_info.get("title", "Unknown")
-                        # Truncate title for display
-                        display_title = (video_title[:30] + '...') if len(video_title) > 30 else video_title
-                        task_id = progress.add_task(f"waiting...", source=source_name, total=100, visible=False, speed="", eta="")
+                    try:
+                        for task in download_tasks:
+                            # Add task to progress bar
+                            video_title = task.video_info.get("title", "Unknown")
+                            # Truncate title for display
+                            display_title = (video_title[:30] + '...') if len(video_title) > 30 else video_title
+                            task_id = progress.add_task(f"waiting...", source=task.source_name, total=100, visible=False, speed="", eta="")
                         
-                        future = executor.submit(
-                            self.download_video, 
-                            video_info, 
-                            source_name, 
-                            is_manual=False,
-                            progress=progress, # Pass the progress object
-                            task_id=task_id    # Pass the task ID
-                        )
-                        future_to_task[future] = (video_info, source_name, task_type)
+                            future = executor.submit(
+                                self._download_in_slot, 
+                                task.video_info, 
+                                task.source_name, 
+                                is_manual=False,
+                                progress=progress, # Pass the progress object
+                                task_id=task_id    # Pass the task ID
+                            )
+                            future_to_task[future] = task
                     
-                    for future in as_completed(future_to_task):
-                        video_info, source_name, task_type = future_to_task[future]
-                        try:
-                            success, video_id = future.result()
-                            if success:
-                                successful_downloads += 1
-                                
-                                # Update comprehensive channel history
-                                if task_type == "channel":
-                                    handle = [k for k, v in self.channels.items() if v == source_name][0]
-                                    self.update_channel_history(handle, video_info)
-                                elif task_type == "playlist":
-                                    # Use playlist URL as channel identifier for playlists
-                                    playlist_url = [url for url, name in self.playlists.items() if name == source_name][0]
-                                    self.update_channel_history(playlist_url, video_info)
+                        for future in as_completed(future_to_task):
+                            task = future_to_task[future]
+                            try:
+                                success, video_id = future.result()
+                                if success:
+                                    successful_downloads += 1
+                                    unsaved_downloads += 1
                                 
-                                # Also update the simple download history for backward compatibility
-                                if task_type == "channel":
-                                    handle = [k for k, v in self.channels.items() if v == source_name][0]
-                                    self.download_history["channels"][handle] = video_id
-                                elif task_type == "playlist":
-                                    playlist_url = [url for url, name in self.playlists.items() if name == source_name][0]
-                                    self.download_history["playlists"][playlist_url] = video_id
+                                    # Update comprehensive channel history (playlists use their URL as
+                                    # the identifier), and the simple download history for backward compatibility
+                                    self.update_channel_history(task.source_key, task.video_info)
+                                    if task.task_type == "channel":
+                                        self.download_history["channels"][task.source_key] = video_id
+                                    elif task.task_type == "playlist":
+                                        self.download_history["playlists"][task.source_key] = video_id
                                 
-                                self.save_download_history()
-                        except Exception as e:
-                            console.print(f"[red]❌ Error in parallel download for {source_name}: {e}[/red]")
+                                    # Rewrite the history file every few completions rather than after each one
+                                    if (unsaved_downloads >= self.HISTORY_SAVE_BATCH
+                                            or time.monotonic() - last_history_save > self.STATE_FLUSH_INTERVAL):
+                                        self.save_download_history()
+                                        unsaved_downloads = 0
+                                        last_history_save = time.monotonic()
+                            except Exception as e:
+                                console.print(f"[red]❌ Error in parallel download for {task.source_name}: {e}[/red]")
+                    except BaseException:
+                        # Queued downloads are dropped; running ones get the terminal's SIGINT,
+                        # so waiting for them is short and no worker is left mid state update
+                        self._stop_downloads.set()
+                        for future in future_to_task:
+                            future.cancel()
+                        executor.shutdown(wait=True)
+                        raise
+                    executor.shutdown()
+            finally:
+                # Also reached on Ctrl+C, so completed downloads are never forgotten
+                if unsaved_downloads:
+                    self.save_download_history()
+            
+            if self.config.auto_tune_parallel_downloads:
+                self._tune_parallel_downloads(len(download_tasks))
         
         return successful_downloads
 
+    def _download_in_slot(self, *args, **kwargs) -> Tuple[bool, str]:
+        """Run download_video once the concurrency controller has a free slot.
+
+        The executor keeps its starting worker count, so this gate is what makes a
+        pool shrink after a timeout or 429 take effect during the same run.
+        """
+        self.concurrency.acquire_slot()
+        try:
+            # Workers already waiting for a slot can't be cancelled; they skip their video instead
+            if self._stop_downloads.is_set():
+                return False, args[0]["id"]
+            return self.download_video(*args, **kwargs)
+        finally:
+            self.concurrency.release_slot()
+
+    def parallel_download_count(self) -> int:
+        """Worker count for the next batch: the tuned size when auto-tuning is on, else the user's setting."""
+        if self.config.auto_tune_parallel_downloads and self.config.tuned_parallel_downloads > 0:
+            return self.concurrency.clamp(self.config.tuned_parallel_downloads)
+        return self.config.max_parallel_downloads
+
+    def _tune_parallel_downloads(self, task_count: int) -> None:
+        """Feed the finished batch to the concurrency controller and persist any change.
+
+        The result is kept in tuned_parallel_downloads; the user's max_parallel_downloads is never rewritten.
+        """
+        # download_videos_parallel seeded the controller with this value; live shrinks are kept
+        previous = self.parallel_download_count()
+        new_value = self.concurrency.finish_batch(task_count)
+        changed = self.concurrency.last_speed != self.config.last_download_speed
+        if new_value != self.config.tuned_parallel_downloads:
+            if new_value != previous:
+                self.logger.info("⚡ Parallel downloads tuned from %s to %s (%.1f MiB/s)",
+                                 previous, new_value, self.concurrency.last_speed / 1024 ** 2)
+            self.config.tuned_parallel_downloads = new_value
+            changed = True
+        if changed:
+            self.config.last_download_speed = self.concurrency.last_speed
+            self.save_config()
+
 
     def run_auto_download(self) -> None:
         """Main automatic execution method - smart video downloading."""
         start_time = time.time()
         
+        # Directories may have been added or removed since the last run in this session
+        self.get_yt_feed_dirs(refresh=True)
+        
         # Run cleanup first
         self.cleanup_old_videos()
         
@@ -1969,7 +2942,7 @@ class YouTubeFeedDownloader:
         stats_text.append(f"📁 Videos: {self.config.current_video_dir}\n", style="yellow")
         stats_text.append(f"🎧 Audio: {self.config.current_audio_dir}\n", style="yellow")
         stats_text.append(f"👀 Monitoring: {len(self.channels)} channels, {len(self.playlists)} playlists\n", style="green")
-        stats_text.append(f"⚡ Parallel: {self.config.max_parallel_downloads} simultaneous downloads\n", style="bold")
+        stats_text.append(f"⚡ Parallel: {self.parallel_download_count()} simultaneous downloads\n", style="bold")
         stats_text.append(f"🔄 Resume: Enabled ({self.config.resume_cache_days} days)\n")
         stats_text.append(f"🧹 Auto-cleanup: {self.config.cleanup_days} days\n")
         if self.config.filter_shorts:
@@ -1978,7 +2951,9 @@ class YouTubeFeedDownloader:
         console.print(Panel(stats_text, title="Configuration", border_style="blue"))
         console.print("")
         
-        if self.is_first_run():
+        # Captured once: the run marks itself completed before the summary is printed
+        first_run = self.is_first_run()
+        if first_run:
             console.print(f"[bold yellow]📺 First run: Will {'ask for recent videos' if self.config.ask_initial_videos else f'download {self.config.initial_videos_per_channel} recent videos'}[/]")
         else:
             console.print(f"[bold cyan]📺 Strategy: Downloading NEW videos (filling gaps + newest)[/]")
@@ -1987,7 +2962,7 @@ class YouTubeFeedDownloader:
         all_download_tasks = []
         
         # FIRST RUN: Ask for recent videos or use default
-        if self.is_first_run():
+        if first_run:
             if self.config.ask_initial_videos:
                 videos_per_channel = self.get_initial_video_limit()
             else:
@@ -1999,17 +2974,29 @@ class YouTubeFeedDownloader:
             else:
                 console.print(f"\n[bold]🚀 First run - skipping initial downloads (limit set to 0)...[/bold]\n")
             
+            # Scan every source concurrently first, then report them in order
+            prefetched = {}
+            if videos_per_channel > 0:
+                fetch_limit = max(videos_per_channel, 20)
+                sources = [(f"https://www.youtube.com/@{handle}/videos", name, fetch_limit) for handle, name in self.channels.items()]
+                sources.extend((url, name, fetch_limit) for url, name in self.playlists.items())
+                prefetched = self.fetch_recent_videos_parallel(sources)
+            
             if self.channels:
                 console.print(Rule("[bold blue]Checking Channels[/]"))
                 for handle, name in self.channels.items():
-                    channel_tasks = self.process_channel_first_run(handle, name, videos_per_channel)
+                    channel_tasks = self.process_channel_first_run(
+                        handle, name, videos_per_channel,
+                        recent_videos=prefetched.get(f"https://www.youtube.com/@{handle}/videos")
+                    )
                     all_download_tasks.extend(channel_tasks)
                     # print() # Spacing handled by Rule/Tree
             
             if self.playlists:
                 console.print(Rule("[bold blue]Checking Playlists[/]"))
                 for url, name in self.playlists.items():
-                    playlist_tasks = self.process_channel_first_run(url, name, videos_per_channel, item_type="playlist")
+                    playlist_tasks = self.process_channel_first_run(url, name, videos_per_channel, item_type="playlist",
+                                                                    recent_videos=prefetched.get(url))
                     all_download_tasks.extend(playlist_tasks)
                     # print()
             
@@ -2021,21 +3008,59 @@ class YouTubeFeedDownloader:
             console.print(Rule("[bold green]Checking for NEW videos[/]"))
             console.print("")
             
-            if self.channels:
-                for handle, name in self.channels.items():
-                    channel_tasks = self.process_channel_auto(handle, name)
+            # Channels checked within min_recheck_seconds are left for a later run
+            due_channels = self.channels_due_for_check()
+            skipped = len(self.channels) - len(due_channels)
+            if skipped:
+                console.print(f"[dim]⏭️  Skipping {skipped} channel(s) checked in the last {self.config.min_recheck_seconds}s[/dim]")
+                self.logger.info("⏭️ Skipping %s recently checked channels", skipped)
+            
+            # All limit questions are asked together before any query runs
+            prompt_limits = self.ask_channel_limits(
+                [(handle, name) for handle, name in due_channels.items() if self.needs_limit_prompt(handle)]
+            )
+            
+            # Then every source is queried up front and in parallel; results are
+            # reported one source at a time in the usual order
+            check_limit = self.channel_check_limit()
+            sources = []
+            for handle, name in due_channels.items():
+                if handle in prompt_limits:
+                    # Prompted channels fetch extra videos so the ones past the limit get marked as seen
+                    fetch_limit = max(prompt_limits[handle], 20)
+                else:
+                    fetch_limit = check_limit
+                sources.append((f"https://www.youtube.com/@{handle}/videos", name, fetch_limit))
+            sources.extend((url, name, self.config.max_videos_per_channel) for url, name in self.playlists.items())
+            prefetched = self.fetch_recent_videos_parallel(sources)
+            
+            if due_channels:
+                for handle, name in due_channels.items():
+                    channel_tasks = self.process_channel_auto(
+                        handle, name,
+                        prefetched.get(f"https://www.youtube.com/@{handle}/videos"),
+                        limit=prompt_limits.get(handle)
+                    )
                     all_download_tasks.extend(channel_tasks)
                     # print()
+                # A failed listing is not a check: those channels are retried next run
+                self.mark_channels_checked([
+                    handle for handle in due_channels
+                    if prefetched.get(f"https://www.youtube.com/@{handle}/videos") is not LISTING_FAILED
+                ])
             
             if self.playlists:
                 console.print(Rule("[bold blue]Checking Playlists[/]"))
                 console.print("")
                 for url, name in self.playlists.items():
-                    playlist_tasks = self.process_playlist_auto(url, name)
+                    playlist_tasks = self.process_playlist_auto(url, name, prefetched.get(url))
                     all_download_tasks.extend(playlist_tasks)
                     # print()
         
         successful_downloads = self.download_videos_parallel(all_download_tasks)
+        self._flush_history()
+        self._flush_resume_state()
+        self._flush_last_download()
         
         elapsed = time.time() - start_time
         
@@ -2049,19 +3074,23 @@ class YouTubeFeedDownloader:
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="green")
         
-        table.add_row("New Downloads", str(successful_downloads))
-        table.add_row("Total Time", f"{elapsed:.1f}s")
+        summary_rows = [
+            ("New Downloads", str(successful_downloads)),
+            ("Total Time", f"{elapsed:.1f}s"),
+        ]
         if successful_downloads > 0:
-            table.add_row("Avg Time/Download", f"{elapsed/successful_downloads:.1f}s")
+            summary_rows.append(("Avg Time/Download", f"{elapsed/successful_downloads:.1f}s"))
+        for row in summary_rows:
+            table.add_row(*row)
             
         console.print(table)
         
-        if self.is_first_run() and successful_downloads == 0 and self.config.initial_videos_per_channel == 0:
+        if first_run and successful_downloads == 0 and self.config.initial_videos_per_channel == 0:
             console.print(f"[yellow]💡 First run completed - no videos downloaded (limit set to 0)[/yellow]")
-        elif self.is_first_run() and successful_downloads > 0:
+        elif first_run and successful_downloads > 0:
             console.print(f"[green]💡 Next run will automatically download NEW videos (max {self.config.max_videos_per_channel} per channel)[/green]")
         
-        self.logger.info(f"📊 Summary - Downloads: {successful_downloads}, Time: {elapsed:.1f}s")
+        self.logger.info("📊 Summary - Downloads: %s, Time: %.1fs", successful_downloads, elapsed)
         
         # Send notification
         if successful_downloads > 0:
@@ -2078,50 +3107,63 @@ class YouTubeFeedDownloader:
     def cleanup_empty_directories(self):
         """Clean up empty YT_feed directories that might have been created."""
         try:
-            # Look for YT_feed directories in the Videos folder
-            videos_dir = Path.home() / "Videos"
-            yt_feed_dirs = list(videos_dir.glob("YT_feed*"))
+            # Look for YT_feed directories in the Videos folder, including ones created during this run
+            yt_feed_dirs = self.get_yt_feed_dirs(refresh=True)
             
-            for directory in yt_feed_dirs:
-                if directory.is_dir():
+            for directory in list(yt_feed_dirs):
+                # Check if this isn't our main current directory
+                if directory.is_dir() and directory != self.config.current_video_dir:
                     # Check if directory is empty or only contains a few files
-                    files = list(directory.glob("*"))
-                    if len(files) <= 1:
-                        # Check if this isn't our main current directory
-                        if directory != self.config.current_video_dir:
+                    with os.scandir(directory) as entries:
+                        listed = [(entry.name, entry.is_file(follow_symlinks=False)) for entry in entries]
+                    if len(listed) <= 1:
+                        try:
+                            # Remove regular files only, relative to the open directory (unlinkat)
+                            # so each name skips a full path lookup; subdirectories are never
+                            # entered, so rmdir below fails safely if one is present
+                            dir_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
                             try:
-                                # Remove all files first
-                                for file_path in directory.glob("*"):
+                                for name, is_file in listed:
+                                    if not is_file:
+                                        continue
                                     try:
-                                        file_path.unlink()
-                                    except:
+                                        if os.unlink in os.supports_dir_fd:
+                                            os.unlink(name, dir_fd=dir_fd)
+                                        else:
+                                            os.unlink(directory / name)
+                                    except OSError:
                                         pass
-                                # Then remove directory
-                                directory.rmdir()
-                                self.logger.info(f"🧹 Cleaned up empty directory: {directory}")
-                            except Exception as e:
-                                self.logger.warning(f"⚠️ Could not remove directory {directory}: {e}")
+                            finally:
+                                os.close(dir_fd)
+                            # Then remove directory
+                            directory.rmdir()
+                            yt_feed_dirs.remove(directory)
+                            self.logger.info("🧹 Cleaned up empty directory: %s", directory)
+                        except Exception as e:
+                            self.logger.warning("⚠️ Could not remove directory %s: %s", directory, e)
         except Exception as e:
-            self.logger.error(f"❌ Error during directory cleanup: {e}")
+            self.logger.error("❌ Error during directory cleanup: %s", e)
 
     def interactive_mode(self):
         """Interactive mode for managing downloads and configuration."""
+        menu_text = Text()
+        menu_text.append("1. 🚀 Run automatic download (SMART mode)\n", style="bold green")
+        menu_text.append("2. 📺 Manage channels\n")
+        menu_text.append("3. 📋 Manage playlists\n")
+        menu_text.append("4. 🎬 Download single video\n")
+        menu_text.append("5. 🎧 Download single audio (MP3)\n")
+        menu_text.append("6. 📚 Download playlist\n")
+        menu_text.append("7. 📊 Show statistics\n")
+        menu_text.append("8. 🔧 Settings\n")
+        menu_text.append("9. 🧹 Clear resume data\n")
+        menu_text.append("0. ❌ Exit", style="bold red")
+
+        # The menu never changes, so build the panel once and reprint it
+        main_menu = Panel(menu_text, title="[bold blue]YouTube Feed Downloader[/]", border_style="blue")
+
         while True:
-            menu_text = Text()
-            menu_text.append("1. 🚀 Run automatic download (SMART mode)\n", style="bold green")
-            menu_text.append("2. 📺 Manage channels\n")
-            menu_text.append("3. 📋 Manage playlists\n")
-            menu_text.append("4. 🎬 Download single video\n")
-            menu_text.append("5. 🎧 Download single audio (MP3)\n")
-            menu_text.append("6. 📚 Download playlist\n")
-            menu_text.append("7. 📊 Show statistics\n")
-            menu_text.append("8. 🔧 Settings\n")
-            menu_text.append("9. 🧹 Clear resume data\n")
-            menu_text.append("0. ❌ Exit", style="bold red")
-            
-            console.print(Panel(menu_text, title="[bold blue]YouTube Feed Downloader[/]", border_style="blue"))
+            console.print(main_menu)
 
-            
             choice = input("\nSelect option (0-9): ").strip()
             
             if choice == "1":
@@ -2143,6 +3185,7 @@ class YouTubeFeedDownloader:
             elif choice == "9":
                 self.clear_all_resume_data()
             elif choice == "0":
+                self._flush_resume_state()
                 print("\n👋 Goodbye!")
                 break
             else:
@@ -2151,12 +3194,13 @@ class YouTubeFeedDownloader:
     def clear_all_resume_data(self):
         """Clear all resume data."""
         try:
-            self.resume_state = {
-                "videos": {},
-                "playlists": {},
-                "last_cleanup": datetime.now().isoformat()
-            }
-            self.save_resume_state()
+            with self._resume_lock:
+                self.resume_state = {
+                    "videos": {},
+                    "playlists": {},
+                    "last_cleanup": datetime.now().isoformat()
+                }
+                self.save_resume_state()
             print("✅ All resume data cleared!")
         except Exception as e:
             print(f"❌ Error clearing resume data: {e}")
@@ -2194,9 +3238,7 @@ class YouTubeFeedDownloader:
         if success and playlist_dir:
             total_seconds, duration_short, file_info = self.calculate_directory_duration(playlist_dir)
             base_name = playlist_dir.name
-            clean_base = re.sub(r'\s*-\s*\d+[hmr]\s*\d*[ms]?in?$', '', base_name)
-            clean_base = re.sub(r'\s*-\s*\d+sec$', '', clean_base)
-            clean_base = re.sub(r'\s*-\s*\d+\.\d+sec$', '', clean_base)
+            clean_base = LEGACY_DURATION_REGEX.sub('', base_name)
             new_playlist_dir = self.rename_directory_with_duration(playlist_dir, clean_base)
             print(f"   📚 Updated: {clean_base} -{duration_short}")
         
@@ -2208,11 +3250,7 @@ class YouTubeFeedDownloader:
         """Manage YouTube channels."""
         while True:
             print(f"\n📺 Channel Management ({len(self.channels)} channels)")
-            print("─" * 40)
-            print("1. 📋 List channels")
-            print("2. ➕ Add channel")
-            print("3. 🗑️ Remove channel")
-            print("4. ↩️ Back to main menu")
+            print(self._CHANNEL_MENU)
             
             choice = input("\nSelect option (1-4): ").strip()
             
@@ -2258,11 +3296,7 @@ class YouTubeFeedDownloader:
         """Manage YouTube playlists."""
         while True:
             print(f"\n📋 Playlist Management ({len(self.playlists)} playlists)")
-            print("─" * 40)
-            print("1. 📋 List playlists")
-            print("2. ➕ Add playlist")
-            print("3. 🗑️ Remove playlist")
-            print("4. ↩️ Back to main menu")
+            print(self._PLAYLIST_MENU)
             
             choice = input("\nSelect option (1-4): ").strip()
             
@@ -2360,6 +3394,23 @@ class YouTubeFeedDownloader:
             print("🔍 Getting video information...")
             print("   ❌ No video found or error")
 
+    @staticmethod
+    def _scan_counts(directory: Path, suffix: str) -> Tuple[int, List[str]]:
+        """Count files ending in suffix and collect subdirectory paths in one scandir pass."""
+        count = 0
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # DirEntry type checks use the cached d_type, no stat per entry
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith(suffix):
+                        count += 1
+        except OSError:
+            pass
+        return count, subdirs
+
     def show_statistics(self):
         """Show download statistics."""
         console.print(Rule("[bold magenta]Download Statistics[/]"))
@@ -2369,56 +3420,59 @@ class YouTubeFeedDownloader:
         config_table.add_column("Key", style="cyan")
         config_table.add_column("Value", style="white")
         
-        config_table.add_row("📁 Video directory", str(self.config.current_video_dir))
-        config_table.add_row("🎧 Audio directory", str(self.config.current_audio_dir))
-        config_table.add_row("📚 Playlist directory", str(self.config.current_playlist_dir))
-        config_table.add_row("📻 Podcast directory", str(self.config.current_podcast_dir))
-        config_table.add_row("📺 Channels monitored", str(len(self.channels)))
-        config_table.add_row("📋 Playlists monitored", str(len(self.playlists)))
-        config_table.add_row("⚡ Parallel downloads", str(self.config.max_parallel_downloads))
-        config_table.add_row("🔒 Privacy mode", "Enabled")
-        config_table.add_row("🔄 Resume cache", f"{self.config.resume_cache_days} days")
-        config_table.add_row("✅ First run completed", 'Yes' if not self.is_first_run() else 'No')
-        config_table.add_row("🔔 Ask for recent videos", 'Yes' if self.config.ask_initial_videos else 'No')
-        config_table.add_row("📊 Max videos to check", str(self.config.max_videos_per_channel))
+        config_rows = [
+            ("📁 Video directory", str(self.config.current_video_dir)),
+            ("🎧 Audio directory", str(self.config.current_audio_dir)),
+            ("📚 Playlist directory", str(self.config.current_playlist_dir)),
+            ("📻 Podcast directory", str(self.config.current_podcast_dir)),
+            ("📺 Channels monitored", str(len(self.channels))),
+            ("📋 Playlists monitored", str(len(self.playlists))),
+            ("⚡ Parallel downloads", str(self.config.max_parallel_downloads)),
+            ("🔒 Privacy mode", "Enabled"),
+            ("🔄 Resume cache", f"{self.config.resume_cache_days} days"),
+            ("✅ First run completed", 'Yes' if not self.is_first_run() else 'No'),
+            ("🔔 Ask for recent videos", 'Yes' if self.config.ask_initial_videos else 'No'),
+            ("📊 Max videos to check", str(self.config.max_videos_per_channel)),
+        ]
+        for row in config_rows:
+            config_table.add_row(*row)
         
         console.print(Panel(config_table, title="Configuration", border_style="blue"))
         
         # Calculate stats
         total_downloaded_videos = 0
-        for channel_data in self.channel_history.get("channels", {}).values():
-            total_downloaded_videos += len(channel_data.get("downloaded_videos", []))
+        for channel_data in self._channels_index.values():
+            total_downloaded_videos += channel_data.get("video_count", 0)
             
         video_resume_count = len(self.resume_state.get("videos", {}))
         playlist_resume_count = len(self.resume_state.get("playlists", {}))
         
-        video_files = list(self.config.current_video_dir.glob("*.mp4"))
-        audio_files = list(self.config.current_audio_dir.glob("*.mp3"))
-        
-        playlist_dirs = [d for d in self.config.current_playlist_dir.iterdir() if d.is_dir()]
-        podcast_dirs = [d for d in self.config.current_podcast_dir.iterdir() if d.is_dir()]
+        video_count, _ = self._scan_counts(self.config.current_video_dir, ".mp4")
+        audio_count, _ = self._scan_counts(self.config.current_audio_dir, ".mp3")
         
-        playlist_videos = 0
-        for playlist_dir in playlist_dirs:
-            playlist_videos += len(list(playlist_dir.glob("*.mp4")))
+        _, playlist_dirs = self._scan_counts(self.config.current_playlist_dir, ".mp4")
+        _, podcast_dirs = self._scan_counts(self.config.current_podcast_dir, ".mp3")
         
-        podcast_files = 0
-        for podcast_dir in podcast_dirs:
-            podcast_files += len(list(podcast_dir.glob("*.mp3")))
+        playlist_videos = sum(self._scan_counts(playlist_dir, ".mp4")[0] for playlist_dir in playlist_dirs)
+        podcast_files = sum(self._scan_counts(podcast_dir, ".mp3")[0] for podcast_dir in podcast_dirs)
             
         # Stats Table
         stats_table = Table(show_header=True, header_style="bold magenta")
         stats_table.add_column("Metric", style="cyan")
         stats_table.add_column("Count", style="green")
         
-        stats_table.add_row("📥 Total videos tracked", str(total_downloaded_videos))
-        stats_table.add_row("📋 Resume states", f"{video_resume_count} videos, {playlist_resume_count} playlists")
-        stats_table.add_row("🎬 Total videos downloaded", str(len(video_files)))
-        stats_table.add_row("🎧 Total audio files", str(len(audio_files)))
-        stats_table.add_row("📚 Total video playlists", str(len(playlist_dirs)))
-        stats_table.add_row("📹 Total playlist videos", str(playlist_videos))
-        stats_table.add_row("📻 Total podcast playlists", str(len(podcast_dirs)))
-        stats_table.add_row("🎵 Total podcast files", str(podcast_files))
+        stats_rows = [
+            ("📥 Total videos tracked", str(total_downloaded_videos)),
+            ("📋 Resume states", f"{video_resume_count} videos, {playlist_resume_count} playlists"),
+            ("🎬 Total videos downloaded", str(video_count)),
+            ("🎧 Total audio files", str(audio_count)),
+            ("📚 Total video playlists", str(len(playlist_dirs))),
+            ("📹 Total playlist videos", str(playlist_videos)),
+            ("📻 Total podcast playlists", str(len(podcast_dirs))),
+            ("🎵 Total podcast files", str(podcast_files)),
+        ]
+        for row in stats_rows:
+            stats_table.add_row(*row)
         
         console.print(stats_table)
         
@@ -2446,6 +3500,23 @@ class YouTubeFeedDownloader:
                 console.print(f"[dim]   🎬 Title:    {title}[/dim]")
                 console.print(f"[dim]   ⏱️  Duration: {dur}[/dim]")
 
+    def _prompt_numeric_setting(self, choice: str) -> bool:
+        """Ask for a new value of a numeric setting; returns True when it was changed."""
+        field, prompt, label, minimum, maximum = self._NUMERIC_SETTINGS[choice]
+        if maximum is None:
+            maximum = self.config.max_videos_per_channel
+        try:
+            new_value = int(input(f"{prompt} ({minimum}-{maximum}): "))
+        except ValueError:
+            print("❌ Please enter a valid number")
+            return False
+        if not minimum <= new_value <= maximum:
+            print(f"❌ Please enter a number between {minimum} and {maximum}")
+            return False
+        setattr(self.config, field, new_value)
+        print(f"✅ {label} set to: {new_value}")
+        return True
+
     def manage_settings(self):
         """Manage application settings."""
         while True:
@@ -2461,51 +3532,18 @@ class YouTubeFeedDownloader:
             
             choice = input("\nSelect option (1-7): ").strip()
             
-            if choice == "1":
-                try:
-                    new_value = int(input(f"Enter new parallel download count (1-5): "))
-                    if 1 <= new_value <= 5:
-                        self.config.max_parallel_downloads = new_value
-                        print(f"✅ Parallel downloads set to: {new_value}")
-                    else:
-                        print("❌ Please enter a number between 1 and 5")
-                except ValueError:
-                    print("❌ Please enter a valid number")
-            elif choice == "2":
-                try:
-                    new_value = int(input(f"Enter resume cache days (1-30): "))
-                    if 1 <= new_value <= 30:
-                        self.config.resume_cache_days = new_value
-                        print(f"✅ Resume cache days set to: {new_value}")
+            if choice in self._NUMERIC_SETTINGS:
+                field = self._NUMERIC_SETTINGS[choice][0]
+                if self._prompt_numeric_setting(choice):
+                    if field == "resume_cache_days":
                         self.cleanup_old_resume_entries()
-                    else:
-                        print("❌ Please enter a number between 1 and 30")
-                except ValueError:
-                    print("❌ Please enter a valid number")
+                    elif field == "max_parallel_downloads":
+                        # A new explicit choice restarts auto-tuning from it
+                        self.config.tuned_parallel_downloads = 0
             elif choice == "3":
                 self.config.ask_initial_videos = not self.config.ask_initial_videos
                 status = "ENABLED" if self.config.ask_initial_videos else "DISABLED"
                 print(f"✅ Ask for recent videos on first run: {status}")
-            elif choice == "4":
-                try:
-                    new_value = int(input(f"Enter auto-download recent videos count (0-{self.config.max_videos_per_channel}): "))
-                    if 0 <= new_value <= self.config.max_videos_per_channel:
-                        self.config.initial_videos_per_channel = new_value
-                        print(f"✅ Auto-download recent videos set to: {new_value}")
-                    else:
-                        print(f"❌ Please enter a number between 0 and {self.config.max_videos_per_channel}")
-                except ValueError:
-                    print("❌ Please enter a valid number")
-            elif choice == "5":
-                try:
-                    new_value = int(input(f"Enter max videos to check per channel (1-200): "))
-                    if 1 <= new_value <= 200:
-                        self.config.max_videos_per_channel = new_value
-                        print(f"✅ Max videos to check per channel set to: {new_value}")
-                    else:
-                        print("❌ Please enter a number between 1 and 200")
-                except ValueError:
-                    print("❌ Please enter a valid number")
             elif choice == "6":
                 print("\nAvailable resolutions: 360, 480, 720, 1080, 1440, 2160")
                 entered_res = input(f"Enter max resolution (current: {self.config.max_resolution}): ").strip()
@@ -2534,85 +3572,67 @@ class YouTubeFeedDownloader:
             print(f"👤 Uploader: {playlist_info['uploader']}")
             print(f"🎬 Videos: {playlist_info['video_count']}")
             
-            # Determine start index based on existing files to fix resume logic
-            start_index = 1
-            if playlist_dir and playlist_dir.exists():
-                existing_files = list(playlist_dir.glob("*.mp4")) + list(playlist_dir.glob("*.mp3")) + list(playlist_dir.glob("*.mkv"))
-                # This is a rough heuristic. Ideally we'd match IDs.
-                # But if we assume sequential download, count + 1 is a good start.
-                # A better way is using yt-dlp's download archive which we should enable.
-                start_index = len(existing_files) + 1
-            
-            # Use download archive to preventing re-downloading
-            download_archive = playlist_dir / "download_archive.txt"
-            
             cmd, playlist_dir = self.build_playlist_download_command(
-                playlist_url, playlist_name, download_type, resume=True, resume_from=start_index
+                playlist_url, playlist_name, download_type, resume=True
             )
             
-            # Add archive file to command
-            cmd.extend(["--download-archive", str(download_archive)])
-            
-            # Add playlist items start index if significant
-            if start_index > 1:
-                 # Check if we really want to skip. 
-                 # Often it's safer to let archive handle it, but for large playlists skipping is faster.
-                 # Let's subtract a small buffer to be safe (e.g. 5) in case of deletions/reordering
-                 safe_start = max(1, start_index - 5)
-                 cmd.extend(["--playlist-start", str(safe_start)])
+            # yt-dlp's download archive skips finished videos by ID, so resuming needs no start index
+            download_archive = playlist_dir / "download_archive.txt"
+            cmd[-1:-1] = ["--download-archive", str(download_archive)]
             
             print(f"📁 Downloading to: {playlist_dir}")
-            print(f"🔄 Resuming from video #{start_index} (approx)")
+            if download_archive.exists():
+                print("🔄 Resuming: videos already in the download archive are skipped")
             
+            # Same merged, blocking line stream as single downloads: reads wake only on
+            # output, and lines still buffered when yt-dlp exits are not dropped
             process = subprocess.Popen(
-                cmd,
+                spawn_command(cmd),
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                stderr=subprocess.STDOUT,
+                bufsize=PIPE_BUFFER_SIZE,
+                close_fds=False
             )
+            enlarge_pipe(process.stdout)
             
-            current_video = start_index 
+            current_video = 1
             total_videos = playlist_info["video_count"]
             current_video_idx = 0 # Track actual index from output
+            # Untagged lines are yt-dlp's warnings and errors; keep the latest for a failure report
+            diagnostic_lines = deque(maxlen=64)
             
-            while True:
-                if process.poll() is not None:
-                    break
-                    
-                ready, _, _ = select.select([process.stdout, process.stderr], [], [], 0.1)
+            for raw_line in process.stdout:
+                if not raw_line.startswith(b'['):
+                    diagnostic_lines.append(raw_line)
+                    continue
+                if not raw_line.startswith(PROGRESS_LINE_TAGS):
+                    continue
                 
-                for stream in ready:
-                    line = stream.readline()
-                    if not line:
-                        continue
-                    
-                    progress = self.parse_progress(line)
-                    if progress:
-                        if progress.get("type") == "playlist_progress":
-                            current_video = int(progress["current"])
-                            total_videos = int(progress["total"])
-                        elif progress.get("type") == "download":
-                             # Handle "NA" percent
-                             percent_val = progress.get("percent", "0")
-                             try:
-                                 current_percent = float(percent_val)
-                             except ValueError:
-                                 current_percent = 0.0
-                                 
-                             if "percent" in progress:
-                                # Calculate overall progress based on video count
-                                overall_percent = ((current_video - 1) / total_videos * 100) + (current_percent / total_videos)
-                                
-                                self.display_double_progress_bar(
-                                    current_percent,
-                                    overall_percent,
-                                    f"Video {current_video}/{total_videos}", # Just count for now as size is hard to predict
-                                    progress.get("size", ""),
-                                    progress.get("speed", ""),
-                                    progress.get("eta", "")
-                                )
+                progress = self.parse_progress(raw_line.decode('utf-8', 'replace'))
+                if progress:
+                    if progress.get("type") == "playlist_progress":
+                        current_video = int(progress["current"])
+                        total_videos = int(progress["total"])
+                    elif progress.get("type") == "download":
+                         # Handle "NA" percent
+                         percent_val = progress.get("percent", "0")
+                         try:
+                             current_percent = float(percent_val)
+                         except ValueError:
+                             current_percent = 0.0
+                             
+                         if "percent" in progress:
+                            # Calculate overall progress based on video count
+                            overall_percent = ((current_video - 1) / total_videos * 100) + (current_percent / total_videos)
+                            
+                            self.display_double_progress_bar(
+                                current_percent,
+                                overall_percent,
+                                f"Video {current_video}/{total_videos}", # Just count for now as size is hard to predict
+                                progress.get("size", ""),
+                                progress.get("speed", ""),
+                                progress.get("eta", "")
+                            )
             
             return_code = process.wait()
             
@@ -2620,24 +3640,48 @@ class YouTubeFeedDownloader:
                 print(f"\n✅ Playlist download complete: {playlist_name}")
                 return True, playlist_dir
             else:
+                error_summary = b"".join(list(diagnostic_lines)[-5:]).decode('utf-8', 'replace').strip() or "Unknown error"
                 print(f"\n❌ Playlist download failed")
+                print(error_summary)
+                self.logger.error("❌ Playlist download failed for %s: %s", playlist_name, error_summary)
                 return False, playlist_dir
                 
         except Exception as e:
-            self.logger.error(f"❌ Error downloading playlist: {e}")
+            self.logger.error("❌ Error downloading playlist: %s", e)
             print(f"❌ Error: {e}")
             return False, None
 
 
+# Encoded once and written in a single call; UTF-8 regardless of the locale's codec
+DEPENDENCY_ERROR_MESSAGE = "\n".join([
+    "❌ Error: Required dependencies missing!",
+    "   Please install:",
+    "   • yt-dlp: pipx install yt-dlp",
+    "   • ffmpeg: sudo pacman -S ffmpeg",
+    "   • ffprobe: sudo pacman -S ffmpeg (included with ffmpeg)",
+    "",
+]).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=1)
 def check_dependencies() -> bool:
-    """Check if required dependencies are available."""
-    try:
-        subprocess.run(["yt-dlp", "--version"], capture_output=True, check=True)
-        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
-        subprocess.run(["ffprobe", "-version"], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    """Check if required dependencies are available (probed once per process)."""
+    # ffprobe ships with ffmpeg; a PATH lookup is enough to confirm it without another process
+    if shutil.which("ffprobe") is None:
         return False
+    probes = (["yt-dlp", "--version"], ["ffmpeg", "-version"])
+    # The tools start up independently, so probe them at once
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures = [
+            executor.submit(subprocess.run, cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+            for cmd in probes
+        ]
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                return False
+    return True
 
 
 def main():
@@ -2648,11 +3692,9 @@ def main():
     args = parser.parse_args()
     
     if not check_dependencies():
-        print("❌ Error: Required dependencies missing!")
-        print("   Please install:")
-        print("   • yt-dlp: pipx install yt-dlp")
-        print("   • ffmpeg: sudo pacman -S ffmpeg")
-        print("   • ffprobe: sudo pacman -S ffmpeg (included with ffmpeg)")
+        sys.stderr.flush()
+        sys.stderr.buffer.write(DEPENDENCY_ERROR_MESSAGE)
+        sys.stderr.buffer.flush()
         sys.exit(1)
     
     config = Config()
@@ -2667,11 +3709,15 @@ def main():
         print("\n\n⚠️ Operation interrupted by user")
         if hasattr(downloader, 'logger'):
             downloader.logger.warning("⚠️ Operation interrupted by user")
-        sys.exit(0)
+        # The executors have already dropped queued work and waited for running downloads;
+        # listing queries run in their own sessions and never saw the Ctrl-C
+        downloader.kill_child_processes()
+        downloader.flush_state()
+        sys.exit(130)
     except Exception as e:
         print(f"\n❌ Fatal error: {e}")
         if hasattr(downloader, 'logger'):
-            downloader.logger.error(f"❌ Fatal error: {e}")
+            downloader.logger.error("❌ Fatal error: %s", e)
         sys.exit(1)
 
 
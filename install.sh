@@ -26,6 +26,8 @@ if command_exists pacman; then
     command_exists yt-dlp || TO_INSTALL="$TO_INSTALL yt-dlp"
     command_exists ffmpeg || TO_INSTALL="$TO_INSTALL ffmpeg"
     python3 -c "import rich" &>/dev/null || TO_INSTALL="$TO_INSTALL python-rich"
+    python3 -c "import mutagen" &>/dev/null || TO_INSTALL="$TO_INSTALL python-mutagen"
+    python3 -c "import orjson" &>/dev/null || TO_INSTALL="$TO_INSTALL python-orjson"
     
     if [ -n "$TO_INSTALL" ]; then
         echo -e "${BLUE}📦 Installing missing packages via pacman:$TO_INSTALL...${NC}"
@@ -36,10 +38,10 @@ if command_exists pacman; then
 elif command_exists apt-get; then
     # Debian/Ubuntu
     sudo apt-get update
-    sudo apt-get install -y yt-dlp ffmpeg python3-rich
+    sudo apt-get install -y yt-dlp ffmpeg python3-rich python3-mutagen python3-orjson
 elif command_exists dnf; then
     # Fedora
-    sudo dnf install -y yt-dlp ffmpeg python3-rich
+    sudo dnf install -y yt-dlp ffmpeg python3-rich python3-mutagen python3-orjson
 else
     echo -e "${RED}❌ Multi-distro support: Package manager not recognized. Please install yt-dlp, ffmpeg, and python-rich manually.${NC}"
 fi